@@ -4,34 +4,154 @@ Professional Web Interface for MALDB RDBMS
 Clean, modern, and functional - designed for database professionals
 """
 from fastapi import FastAPI, Request, Form, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 import uvicorn
+import asyncio
+import threading
 import os
 import sys
 import json
+import re
 import time
-import glob
-import traceback
+import logging
+import queue
+import atexit
+import hashlib
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
-from contextlib import asynccontextmanager
+from pathlib import Path
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache, partial
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+
+# orjson is optional; json.loads accepts the same bytes input and
+# JSONResponse produces the same bodies, only slower
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as ApiJSONResponse
+    _json_loads = orjson.loads
+
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode("utf-8")
+except ImportError:
+    ApiJSONResponse = JSONResponse
+    _json_loads = json.loads
+
+    def _json_dumps(value) -> str:
+        return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(BASE_DIR)
 sys.path.insert(0, PROJECT_ROOT)
 
+# Request-path diagnostics; DEBUG is off unless MALDB_LOG_LEVEL asks for it
+log = logging.getLogger("maldb.demo")
+
+# Worker pool for blocking database and filesystem calls, created in lifespan
+_db_pool: Optional[ThreadPoolExecutor] = None
+
+# Database handles already checked out by the current request, keyed by name
+_request_dbs: ContextVar[Optional[Dict]] = ContextVar("maldb_request_dbs", default=None)
+
+async def run_blocking(func, *args):
+    """Run a blocking call on the database pool so the event loop stays free"""
+    # Carry the request's context into the worker thread, as asyncio.to_thread does
+    return await asyncio.get_running_loop().run_in_executor(
+        _db_pool, copy_context().run, partial(func, *args)
+    )
+
+# Per-table schema files inside a database's _data directory
+SCHEMA_SUFFIX = "_schema.json"
+_SCHEMA_SUFFIX_LEN = len(SCHEMA_SUFFIX)
+
+def _db_path(name: str) -> str:
+    """Path of a database's .maldb file"""
+    return os.path.join(BASE_DIR, f"{name}.maldb")
+
+def _data_dir(name: str) -> str:
+    """A database's data directory, derived the same way FileManager does"""
+    return _db_path(name).replace('.maldb', '_data')
+
+# Display type for each stored base type; VARCHAR keeps its own length
+_TYPE_CANON = {
+    'INT': 'INT',
+    'INTEGER': 'INT',
+    'VARCHAR': None,
+    'TEXT': 'TEXT',
+    'DECIMAL': 'DECIMAL(10,2)',
+    'BOOLEAN': 'BOOLEAN',
+    'BOOL': 'BOOLEAN',
+}
+
 from src.core.database import Database
+from src.utils.helpers import uvicorn_fast_path
+from src.utils.locks import ReadWriteLock
+
+def _strip_maldb(name: str) -> str:
+    """Database name without a trailing .maldb extension"""
+    return name[:-6] if name.endswith('.maldb') else name
+
+# Statements that only read; they share a database's lock instead of taking it alone
+_READ_PREFIXES = ("SELECT", "EXPLAIN")
+_READ_HEAD_LEN = max(map(len, _READ_PREFIXES))
+
+@lru_cache(maxsize=32)
+def _generic_columns(width: int) -> Tuple[str, ...]:
+    """Column_1..Column_N headers for rows without column names"""
+    return tuple(f"Column_{i+1}" for i in range(width))
+
+_SELECT_COLS_RE = re.compile(r"^\s*SELECT\s+(.+?)\s+FROM\s", re.IGNORECASE | re.DOTALL)
+# Table a plain (non-JOIN) SELECT reads lazily from storage
+_SELECT_TABLE_RE = re.compile(r"^\s*SELECT\s+.+?\s+FROM\s+(\w+)", re.IGNORECASE | re.DOTALL)
+
+@lru_cache(maxsize=256)
+def _headers_for(sql: str, width: int) -> Optional[Tuple[str, ...]]:
+    """Headers from a SELECT's column list, or None for * or a list that doesn't match the rows"""
+    match = _SELECT_COLS_RE.match(sql)
+    if not match:
+        return None
+    body = match.group(1).strip()
+    if body == "*":
+        return None
+    headers = tuple(col.strip() for col in body.split(","))
+    return headers if len(headers) == width else None
 
 # Database connection manager with multi-database support
 class DatabaseManager:
     _instance = None
-    _connections: Dict[str, Database] = {}
+    # Open databases, least recently used first; evicted handles are closed
+    _connections: "OrderedDict[str, Database]" = OrderedDict()
+    _connections_lock = threading.RLock()  # get_db() also runs in worker threads
+    MAX_OPEN_DATABASES = 8
+    IDLE_TIMEOUT = 300.0  # seconds before recycle_idle() closes an unused connection
+    _last_used: Dict[str, float] = {}
     _current_db = "default"  # Track current database
     
+    # list_databases() result, reused while BASE_DIR is unchanged
+    _db_list_cache: Optional[List[Dict]] = None
+    # Paths whose mtimes decide whether the cached list is still exact, and those mtimes
+    _db_list_watch: Tuple[str, ...] = ()
+    _db_list_stamp: Tuple[int, ...] = ()
+    
+    # Reads only touch files and the parsed catalog, so SELECTs on one database
+    # may overlap; anything that writes runs alone
+    _db_locks: Dict[str, "ReadWriteLock"] = {}
+    
+    # db_name -> (data directory mtime_ns, table names)
+    _tables_cache: Dict[str, Tuple[int, List[str]]] = {}
+    
+    # schema file path -> (mtime_ns, get_table_schema() result)
+    _schema_cache: Dict[str, Tuple[int, List[Dict]]] = {}
+    _SCHEMA_CACHE_MAX = 256  # above this, entries for deleted files are pruned
+    
     @classmethod
     def set_current_db(cls, db_name: str):
         """Set the current database"""
@@ -42,141 +162,219 @@ class DatabaseManager:
         """Get current database name"""
         return cls._current_db
     
+    @classmethod
+    def _checkout(cls, name: str) -> Database:
+        """Pooled connection for a database, reopened if its data directory vanished"""
+        with cls._connections_lock:
+            db = cls._connections.get(name)
+            # Pre-ping: a connection whose files were removed underneath it is stale
+            if db is not None and not os.path.isdir(db.file_manager.data_dir):
+                log.debug("Dropping stale connection to %s", name)
+                del cls._connections[name]
+                db = None
+            if db is None:
+                db_path = _db_path(name)
+                log.debug("📁 Creating/loading database: %s at %s", name, db_path)
+                db = Database(db_path)
+                cls._remember_connection(name, db)
+                log.debug("✅ Database '%s' loaded successfully", name)
+            else:
+                cls._connections.move_to_end(name)
+            cls._last_used[name] = time.monotonic()
+        return db
+    
+    @classmethod
+    @contextmanager
+    def acquire(cls, name="default"):
+        """Check out a database connection for the duration of a with-block"""
+        db = cls.get_db(name)
+        try:
+            yield db
+        finally:
+            cls._last_used[_strip_maldb(name)] = time.monotonic()
+    
+    @classmethod
+    def prewarm(cls):
+        """Open connections to known databases ahead of the first request"""
+        for info in cls.list_databases()[:cls.MAX_OPEN_DATABASES]:
+            try:
+                cls._checkout(info["name"])
+            except Exception as e:
+                log.warning("⚠️ Could not prewarm database %s: %s", info["name"], e)
+    
+    @classmethod
+    def recycle_idle(cls):
+        """Close connections unused for IDLE_TIMEOUT seconds, except the current one"""
+        cutoff = time.monotonic() - cls.IDLE_TIMEOUT
+        with cls._connections_lock:
+            idle = [name for name in cls._connections
+                    if name != cls._current_db and cls._last_used.get(name, 0) < cutoff]
+            for name in idle:
+                db = cls._connections.pop(name)
+                cls._last_used.pop(name, None)
+                try:
+                    db.close()
+                except Exception:
+                    pass
+                log.debug("Closed idle database connection: %s", name)
+    
     @classmethod
     def get_db(cls, name="default"):
         """Get or create a database connection"""
         try:
-            if name not in cls._connections:
-                # Remove .maldb extension if provided
-                if name.endswith('.maldb'):
-                    name = name[:-6]
-                
-                db_path = os.path.join(BASE_DIR, f"{name}.maldb")
-                print(f"📁 Creating/loading database: {name} at {db_path}")
-                cls._connections[name] = Database(db_path)
-                print(f"✅ Database '{name}' loaded successfully")
+            # Remove .maldb extension if provided
+            name = _strip_maldb(name)
+            # Within a request, later lookups reuse the first checkout
+            scoped = _request_dbs.get()
+            db = scoped.get(name) if scoped is not None else None
+            if db is None:
+                db = cls._checkout(name)
+                if scoped is not None:
+                    scoped[name] = db
             
             # Update current database
             if name != cls._current_db:
-                print(f"🔄 Switching from {cls._current_db} to {name}")
+                log.debug("🔄 Switching from %s to %s", cls._current_db, name)
                 cls._current_db = name
             
-            return cls._connections[name]
+            return db
         except Exception as e:
-            print(f"❌ Error loading database '{name}': {e}")
-            traceback.print_exc()
+            log.exception("❌ Error loading database '%s': %s", name, e)
             raise
     
+    @classmethod
+    def _remember_connection(cls, name: str, db: Database):
+        """Store a connection as most recently used, closing the oldest past the cap"""
+        with cls._connections_lock:
+            cls._connections[name] = db
+            cls._connections.move_to_end(name)
+            while len(cls._connections) > cls.MAX_OPEN_DATABASES:
+                evicted_name, evicted = cls._connections.popitem(last=False)
+                cls._last_used.pop(evicted_name, None)
+                try:
+                    evicted.close()
+                except Exception:
+                    pass
+                log.debug("Closed least recently used database: %s", evicted_name)
+    
+    @classmethod
+    def _count_databases(cls) -> int:
+        """Number of .maldb files in BASE_DIR, without building list entries"""
+        try:
+            with os.scandir(BASE_DIR) as entries:
+                return sum(1 for entry in entries if entry.name.endswith('.maldb'))
+        except OSError:
+            return 0
+    
+    @classmethod
+    def invalidate_database_list(cls):
+        """Drop the cached list_databases() result"""
+        cls._db_list_cache = None
+    
+    @staticmethod
+    def _mtime_ns(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+    
     @classmethod
     def list_databases(cls):
         """List all available databases in the demo directory"""
-        databases = []
-        pattern = os.path.join(BASE_DIR, "*.maldb")
+        # BASE_DIR changes when a database is added or removed, each .maldb file
+        # when it is rewritten, and each _data directory when a table comes or goes
+        if (cls._db_list_cache is not None
+                and tuple(map(cls._mtime_ns, cls._db_list_watch)) == cls._db_list_stamp):
+            return cls._db_list_cache
         
-        print(f"🔍 Scanning for database files with pattern: {pattern}")
+        databases = []
+        watch = [BASE_DIR]
+        stamp = [cls._mtime_ns(BASE_DIR)]
         
-        # Clear any cached file listings
-        import glob
-        if hasattr(glob, '_cache'):
-            glob._cache.clear()
+        log.debug("🔍 Scanning for database files in: %s", BASE_DIR)
         
+        # One directory pass; DirEntry caches the file type and stat result
         try:
-            db_files = glob.glob(pattern)
-            print(f"🔍 Found {len(db_files)} .maldb files: {db_files}")
+            with os.scandir(BASE_DIR) as entries:
+                db_entries = [entry for entry in entries
+                              if entry.name.endswith('.maldb') and entry.is_file()]
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🔍 Found %s .maldb files: %s", len(db_entries), [entry.name for entry in db_entries])
         except Exception as e:
-            print(f"❌ Error scanning for database files: {e}")
-            db_files = []
+            log.error("❌ Error scanning for database files: %s", e)
+            db_entries = []
         
         # Always include default first
-        default_exists = False
+        default_entry = None
         
-        for db_file in db_files:
+        for entry in db_entries:
+            db_file = entry.path
             try:
-                db_name = os.path.basename(db_file).replace(".maldb", "")
-                print(f"📁 Processing database file: {db_name} ({db_file})")
-                
-                # Check if file is accessible
-                if not os.path.exists(db_file):
-                    print(f"⚠️  Database file doesn't exist: {db_file}")
-                    continue
+                db_name = _strip_maldb(entry.name)
+                log.debug("📁 Processing database file: %s (%s)", db_name, db_file)
                     
                 # Get database info
                 tables = 0
                 # Count tables by checking for schema files
                 data_dir = db_file.replace('.maldb', '_data')
-                if os.path.exists(data_dir):
-                    schema_files = glob.glob(os.path.join(data_dir, "*_schema.json"))
-                    tables = len(schema_files)
-                    print(f"   Found {tables} tables in {data_dir}")
-                else:
-                    print(f"   No data directory found for {db_name}")
+                file_stat = entry.stat(follow_symlinks=False)
+                watch += (db_file, data_dir)
+                stamp += (file_stat.st_mtime_ns, cls._mtime_ns(data_dir))
+                try:
+                    with os.scandir(data_dir) as data_entries:
+                        tables = sum(1 for data_entry in data_entries
+                                     if data_entry.name.endswith(SCHEMA_SUFFIX))
+                    log.debug("   Found %s tables in %s", tables, data_dir)
+                except FileNotFoundError:
+                    log.debug("   No data directory found for %s", db_name)
                 
-                databases.append({
+                info = {
                     "name": db_name,
                     "path": db_file,
                     "tables": tables,
-                    "size": os.path.getsize(db_file) if os.path.exists(db_file) else 0
-                })
-                
+                    "size": file_stat.st_size
+                }
                 if db_name == "default":
-                    default_exists = True
+                    default_entry = info
+                else:
+                    databases.append(info)
                     
             except Exception as e:
-                print(f"❌ Error processing {db_file}: {e}")
-                traceback.print_exc()
+                log.exception("❌ Error processing %s: %s", db_file, e)
         
-        print(f"📋 Total databases found: {len(databases)}")
+        log.debug("📋 Total databases found: %s", len(databases) + (default_entry is not None))
         
-        # If we found no databases at all, make sure default exists
-        if len(databases) == 0:
-            print("⚠️  No databases found, creating default placeholder")
-            default_path = os.path.join(BASE_DIR, "default.maldb")
-            databases.append({
+        # If default doesn't exist in files, add a placeholder for it
+        if default_entry is None:
+            if not databases:
+                log.warning("⚠️  No databases found, creating default placeholder")
+            else:
+                log.debug("➕ Adding default database to list")
+            default_entry = {
                 "name": "default",
-                "path": default_path,
+                "path": _db_path("default"),
                 "tables": 0,
                 "size": 0
-            })
-            default_exists = True
+            }
         
-        # Make sure default is always first
-        if default_exists:
-            # Sort: default first, then others alphabetically
-            databases.sort(key=lambda x: (x["name"] != "default", x["name"].lower()))
-        else:
-            # If default doesn't exist in files, add it
-            print("➕ Adding default database to list")
-            databases.insert(0, {
-                "name": "default",
-                "path": os.path.join(BASE_DIR, "default.maldb"),
-                "tables": 0,
-                "size": 0
-            })
+        # Default first, then the others alphabetically
+        databases.sort(key=lambda db: db["name"].lower())
+        databases.insert(0, default_entry)
         
-        print(f"✅ Final database list: {[db['name'] for db in databases]}")
-        return databases
-    
-    @classmethod
-    def refresh_databases(cls):
-        """Refresh the database list by clearing any caches"""
-        # Clear any cached glob results
-        import glob
-        if hasattr(glob, '_cache'):
-            glob._cache.clear()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("✅ Final database list: %s", [db['name'] for db in databases])
         
-        # Also clear any file system caches
-        import sys
-        if sys.version_info >= (3, 4):
-            import importlib
-            importlib.invalidate_caches()
+        cls._db_list_cache = databases
+        cls._db_list_watch = tuple(watch)
+        cls._db_list_stamp = tuple(stamp)
+        return databases
     
     @classmethod
     def create_database(cls, name: str):
         """Create a new database"""
         try:
             # Remove .maldb extension if provided
-            if name.endswith('.maldb'):
-                name = name[:-6]
+            name = _strip_maldb(name)
             
             # Validate name
             if not name.replace('_', '').isalnum():
@@ -189,36 +387,23 @@ class DatabaseManager:
             if name in cls._connections:
                 return False, f"Database '{name}' already loaded in memory"
             
-            db_path = os.path.join(BASE_DIR, f"{name}.maldb")
+            db_path = _db_path(name)
             
             # Check if file already exists
             if os.path.exists(db_path):
                 return False, f"Database file '{name}.maldb' already exists"
             
-            print(f"🆕 Creating new database: {name} at {db_path}")
+            log.debug("🆕 Creating new database: %s at %s", name, db_path)
             
             try:
-                # First, check if default database exists to copy structure
-                default_path = os.path.join(BASE_DIR, "default.maldb")
-                
-                # Create database by initializing it
-                print(f"📝 Initializing database '{name}'...")
+                # Create database by initializing it; the constructor sets up the data directory
+                log.debug("📝 Initializing database '%s'...", name)
                 db = Database(db_path)
                 
-                # Force initialization by executing a simple statement
-                # This creates the necessary database structure
-                try:
-                    # Try to create a dummy table to ensure database is properly initialized
-                    db.execute("CREATE TABLE __maldb_init_test (id INT PRIMARY KEY)")
-                    db.execute("DROP TABLE __maldb_init_test")
-                    print(f"✅ Database '{name}' initialized with schema")
-                except Exception as init_error:
-                    print(f"⚠️  Initialization test failed (might be OK): {init_error}")
-                
                 # Verify file was created
                 if not os.path.exists(db_path):
                     # Create a minimal database file if it wasn't created
-                    print(f"⚠️  Database file not created, creating minimal structure...")
+                    log.warning("⚠️  Database file not created, creating minimal structure...")
                     import pickle
                     # Create a basic database structure
                     minimal_db = {
@@ -229,160 +414,215 @@ class DatabaseManager:
                         pickle.dump(minimal_db, f)
                 
                 # Create data directory if it doesn't exist
-                data_dir = db_path.replace('.maldb', '_data')
+                data_dir = _data_dir(name)
                 if not os.path.exists(data_dir):
                     os.makedirs(data_dir, exist_ok=True)
-                    print(f"📁 Created data directory: {data_dir}")
+                    log.debug("📁 Created data directory: %s", data_dir)
                 
                 # Store connection
-                cls._connections[name] = db
+                cls._remember_connection(name, db)
                 
-                # Force a refresh of the file system
-                cls.refresh_databases()
+                # Make the next listing rescan BASE_DIR
+                cls.invalidate_database_list()
                 
                 # Verify creation
                 if os.path.exists(db_path):
                     file_size = os.path.getsize(db_path)
-                    print(f"✅ Database '{name}' created successfully at {db_path}")
-                    print(f"📊 File size: {file_size} bytes")
-                    
-                    # Test the database connection
-                    try:
-                        test_result = cls.execute_query("SELECT 1", name)
-                        if test_result["success"]:
-                            print(f"✅ Database '{name}' is functional")
-                        else:
-                            print(f"⚠️  Database created but test query failed: {test_result['error']}")
-                    except Exception as test_error:
-                        print(f"⚠️  Database created but test failed: {test_error}")
-                    
+                    log.debug("✅ Database '%s' created successfully at %s", name, db_path)
+                    log.debug("📊 File size: %s bytes", file_size)
                     return True, f"Database '{name}' created successfully"
                 else:
                     return False, f"Database file was not created at {db_path}"
                     
             except Exception as db_error:
-                print(f"❌ Database creation error: {db_error}")
-                traceback.print_exc()
+                log.exception("❌ Database creation error: %s", db_error)
                 
                 # Clean up any partially created files
                 if os.path.exists(db_path):
                     try:
                         os.remove(db_path)
-                        print(f"🧹 Cleaned up partially created file: {db_path}")
+                        log.debug("🧹 Cleaned up partially created file: %s", db_path)
                     except:
                         pass
                 
-                data_dir = db_path.replace('.maldb', '_data')
+                data_dir = _data_dir(name)
                 if os.path.exists(data_dir):
                     try:
                         import shutil
                         shutil.rmtree(data_dir)
-                        print(f"🧹 Cleaned up data directory: {data_dir}")
+                        log.debug("🧹 Cleaned up data directory: %s", data_dir)
                     except:
                         pass
                 
                 return False, f"Database creation failed: {str(db_error)}"
                 
         except Exception as e:
-            print(f"❌ Error creating database '{name}': {e}")
-            traceback.print_exc()
+            log.exception("❌ Error creating database '%s': %s", name, e)
             return False, f"Error creating database: {str(e)}"
     
     @classmethod
     def delete_database(cls, name: str):
         """Delete a database"""
         try:
-            print(f"🗑️ Attempting to delete database: {name}")
+            log.debug("🗑️ Attempting to delete database: %s", name)
             
             # Don't allow deleting current database if it's the only one
-            databases = cls.list_databases()
-            if len(databases) <= 1 and name == "default":
+            if name == "default" and cls._count_databases() <= 1:
                 return False, "Cannot delete the only database"
             
             # Close connection if open
-            if name in cls._connections:
-                db = cls._connections[name]
+            with cls._connections_lock:
+                db = cls._connections.pop(name, None)
+            if db is not None:
                 try:
                     db.close()
                 except:
                     pass
-                del cls._connections[name]
             
             # Delete database files
-            db_path = os.path.join(BASE_DIR, f"{name}.maldb")
-            data_dir = db_path.replace('.maldb', '_data')
+            db_path = _db_path(name)
+            data_dir = _data_dir(name)
             
             deleted_files = []
             
             if os.path.exists(db_path):
                 os.remove(db_path)
                 deleted_files.append(db_path)
-                print(f"🗑️ Deleted database file: {db_path}")
+                log.debug("🗑️ Deleted database file: %s", db_path)
             
             # Delete data directory
             if os.path.exists(data_dir):
                 import shutil
                 shutil.rmtree(data_dir)
                 deleted_files.append(data_dir)
-                print(f"🗑️ Deleted data directory: {data_dir}")
+                log.debug("🗑️ Deleted data directory: %s", data_dir)
             
             # Switch to default if deleting current
             if cls._current_db == name:
                 cls._current_db = "default"
                 # Ensure default exists
-                if not os.path.exists(os.path.join(BASE_DIR, "default.maldb")):
+                if not os.path.exists(_db_path("default")):
                     # Create a fresh default
                     try:
-                        db = Database(os.path.join(BASE_DIR, "default.maldb"))
-                        cls._connections["default"] = db
-                        print(f"🔄 Created new default database")
+                        db = Database(_db_path("default"))
+                        cls._remember_connection("default", db)
+                        log.debug("🔄 Created new default database")
                     except Exception as e:
-                        print(f"⚠️ Could not create new default: {e}")
+                        log.warning("⚠️ Could not create new default: %s", e)
             
-            print(f"✅ Database '{name}' deleted successfully")
+            cls.invalidate_database_list()
+            log.debug("✅ Database '%s' deleted successfully", name)
             return True, f"Database '{name}' deleted successfully"
         except Exception as e:
-            print(f"❌ Error deleting database '{name}': {e}")
-            traceback.print_exc()
+            log.exception("❌ Error deleting database '%s': %s", name, e)
             return False, f"Error deleting database: {str(e)}"
     
     @classmethod
-    def execute_query(cls, sql: str, db_name="default"):
-        """Execute SQL query on specified database"""
+    def _query_lock(cls, db_name: str, sql: str):
+        """Shared lock for read-only statements, exclusive for everything else"""
+        lock = cls._db_locks.get(db_name) or cls._db_locks.setdefault(db_name, ReadWriteLock())
+        head = sql.lstrip()[:_READ_HEAD_LEN].upper()
+        return lock.read() if head.startswith(_READ_PREFIXES) else lock.write()
+    
+    @classmethod
+    async def stream_query(cls, sql: str, db_name="default", params: Optional[List] = None):
+        """
+        Yield a query as NDJSON lines, reading rows from storage in batches
+        
+        The first line is an object with success, columns and database, followed
+        by one JSON array per row and a closing object with affected_rows and
+        execution_time. A failure is reported as a final {"success": false} line.
+        
+        The database lock is held only while a batch is fetched, never while the
+        client reads, so a slow client cannot stall writers. A SELECT whose table
+        is written between batches is aborted rather than mixing two versions.
+        """
+        start_time = time.time()
+        affected_rows = 0
+        table_match = _SELECT_TABLE_RE.match(sql) if "JOIN" not in sql.upper() else None
+        table_name = table_match.group(1) if table_match else None
+        
+        def fetch(file_manager, rows, stamp=None):
+            """Next batch of rows, checking the table is unchanged since the last one"""
+            if stamp is not None and file_manager.table_stamp(table_name) != stamp:
+                raise RuntimeError(f"Table '{table_name}' changed while its rows were being streamed")
+            batch = list(islice(rows, STREAM_BATCH_ROWS))
+            return batch, file_manager.table_stamp(table_name) if table_name else None
+        
         try:
-            print(f"⚡ Executing SQL on '{db_name}': {sql[:100]}...")
-            
-            # Get or create database connection
-            db = cls.get_db(db_name)
+            with cls.acquire(db_name) as db:
+                rows = db.iter_execute(sql, params)
+                async with cls._query_lock(db_name, sql):
+                    batch, stamp = await run_blocking(fetch, db.file_manager, rows)
+                yield _dump_json({
+                    "success": True,
+                    "columns": cls._extract_columns(batch, sql),
+                    "database": db_name
+                }) + "\n"
+                while batch:
+                    affected_rows += len(batch)
+                    yield "".join(_dump_json(row) + "\n" for row in batch)
+                    async with cls._query_lock(db_name, sql):
+                        batch, stamp = await run_blocking(fetch, db.file_manager, rows, stamp)
+        except Exception as e:
+            log.warning("❌ Streamed query failed: %s", e)
+            yield _dump_json({"success": False, "error": str(e), "database": db_name}) + "\n"
+            return
+        
+        yield _dump_json({
+            "affected_rows": affected_rows,
+            "execution_time": round((time.time() - start_time) * 1000, 2)
+        }) + "\n"
+    
+    @classmethod
+    async def execute_query(cls, sql: str, db_name="default", params: Optional[List] = None,
+                            max_rows: Optional[int] = None):
+        """Execute SQL query on specified database in a worker thread"""
+        try:
+            log.debug("⚡ Executing SQL on '%s': %s...", db_name, sql[:100])
             
+            # A bounded SELECT reads one row past the cap, so truncation is detected
+            # without materializing the rest of the table
+            bounded = max_rows is not None and sql.lstrip()[:6].upper() == "SELECT"
+            truncated = False
             start_time = time.time()
-            result = db.execute(sql)
+            async with cls._query_lock(db_name, sql):
+                with cls.acquire(db_name) as db:
+                    if bounded:
+                        rows = db.iter_execute(sql, params)
+                        result = await run_blocking(list, islice(rows, max_rows + 1))
+                    else:
+                        result = await run_blocking(db.execute, sql, params)
             execution_time = time.time() - start_time
             
-            # Format result properly
-            formatted_result = []
-            affected_rows = 0
+            if bounded and len(result) > max_rows:
+                del result[max_rows:]
+                truncated = True
             
+            # Format result, row count and columns in one pass
             if isinstance(result, list):
                 formatted_result = result
-                affected_rows = len(result)
             elif result is not None:
                 formatted_result = [result]
-                affected_rows = 1
+            else:
+                formatted_result = []
+            affected_rows = len(formatted_result)
+            columns = cls._extract_columns(formatted_result, sql)
             
-            print(f"✅ Query executed successfully ({execution_time:.3f}s, {affected_rows} rows)")
+            log.debug("✅ Query executed successfully (%.3fs, %s rows)", execution_time, affected_rows)
             
             return {
                 "success": True,
                 "result": formatted_result,
                 "execution_time": round(execution_time * 1000, 2),  # ms
                 "affected_rows": affected_rows,
-                "columns": cls._extract_columns(formatted_result) if formatted_result else [],
+                "row_count": affected_rows,
+                "truncated": truncated,
+                "columns": columns,
                 "database": db_name
             }
         except Exception as e:
-            print(f"❌ Query execution failed: {e}")
-            traceback.print_exc()
+            log.warning("❌ Query execution failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -391,120 +631,173 @@ class DatabaseManager:
             }
     
     @classmethod
-    def _extract_columns(cls, result):
+    def _extract_columns(cls, result, sql: str = ""):
         """Extract column names from result"""
         if not result:
-            return []
+            return ()
         
-        if isinstance(result[0], (list, tuple)):
-            # Try to get column names from first row if it's a dict
-            if result[0] and isinstance(result[0], dict):
-                return list(result[0].keys())
-            else:
-                return [f"Column_{i+1}" for i in range(len(result[0]))]
-        elif isinstance(result[0], dict):
-            return list(result[0].keys())
+        first = result[0]
+        row_type = type(first)
+        if row_type is tuple or row_type is list:
+            # Shared per-width tuples; both serialize as JSON arrays like a list
+            return _headers_for(sql, len(first)) or _generic_columns(len(first))
+        if row_type is dict:
+            return list(first.keys())
         return ["Result"]
     
+    @classmethod
+    def _scan_tables(cls, db_name: str) -> List[str]:
+        """Tables with a schema file in the data directory, cached by directory mtime"""
+        data_dir = _data_dir(db_name)
+        # Creating or dropping a table adds/removes a schema file, which
+        # bumps the directory mtime; rescan only when that changes
+        try:
+            data_mtime = os.stat(data_dir).st_mtime_ns
+        except FileNotFoundError:
+            cls._tables_cache.pop(db_name, None)
+            return []
+        cached = cls._tables_cache.get(db_name)
+        if cached and cached[0] == data_mtime:
+            return cached[1]
+        with os.scandir(data_dir) as entries:
+            tables = [entry.name[:-_SCHEMA_SUFFIX_LEN] for entry in entries
+                      if entry.name.endswith(SCHEMA_SUFFIX) and entry.is_file()]
+        cls._tables_cache[db_name] = (data_mtime, tables)
+        return tables
+    
     @classmethod
     def get_tables(cls, db_name="default"):
         """Get list of all tables in database"""
         try:
-            print(f"📊 Getting tables for database: {db_name}")
+            log.debug("📊 Getting tables for database: %s", db_name)
             db = cls.get_db(db_name)
             
             # Method 1: Check data directory for schema files
             try:
-                # Try to access the data directory
-                db_path = os.path.join(BASE_DIR, f"{db_name}.maldb")
-                data_dir = db_path.replace('.maldb', '_data')
-                
-                tables = []
-                
-                if os.path.exists(data_dir):
-                    schema_files = glob.glob(os.path.join(data_dir, "*_schema.json"))
-                    for schema_file in schema_files:
-                        table_name = os.path.basename(schema_file).replace("_schema.json", "")
-                        tables.append(table_name)
-                
+                tables = cls._scan_tables(db_name)
                 if tables:
-                    print(f"Found {len(tables)} tables in data directory for {db_name}: {tables}")
+                    log.debug("Found %s tables in data directory for %s: %s", len(tables), db_name, tables)
                     return tables
             except Exception as e:
-                print(f"Could not access data directory for {db_name}: {e}")
+                log.warning("Could not access data directory for %s: %s", db_name, e)
             
             # Method 2: Try to get from catalog
             try:
                 if hasattr(db, 'catalog') and hasattr(db.catalog, 'tables'):
                     tables = list(db.catalog.tables.keys())
                     if tables:
-                        print(f"Found {len(tables)} tables in catalog for {db_name}: {tables}")
+                        log.debug("Found %s tables in catalog for %s: %s", len(tables), db_name, tables)
                         return tables
             except Exception as e:
-                print(f"Could not access catalog for {db_name}: {e}")
+                log.warning("Could not access catalog for %s: %s", db_name, e)
             
-            print(f"No tables found for {db_name}")
+            log.debug("No tables found for %s", db_name)
             return []
             
         except Exception as e:
-            print(f"❌ Error getting tables for {db_name}: {e}")
-            traceback.print_exc()
+            log.exception("❌ Error getting tables for %s: %s", db_name, e)
             return []
     
+    @classmethod
+    def tables_etag(cls, db_name: str) -> Optional[str]:
+        """Validator for the last get_tables() result, from the data directory mtime"""
+        cached = cls._tables_cache.get(db_name)
+        return f'W/"{db_name}-{cached[0]}"' if cached else None
+    
+    @classmethod
+    def schema_etag(cls, table_name: str, db_name: str) -> Optional[str]:
+        """Validator for a cached table schema, from the schema file mtime"""
+        data_dir = _data_dir(db_name)
+        cached = cls._schema_cache.get(os.path.join(data_dir, f"{table_name}{SCHEMA_SUFFIX}"))
+        return f'W/"{db_name}-{table_name}-{cached[0]}"' if cached else None
+    
+    @classmethod
+    def _prune_schema_cache(cls):
+        """Drop cached schemas whose files no longer exist"""
+        for path in list(cls._schema_cache):
+            if not os.path.exists(path):
+                cls._schema_cache.pop(path, None)
+    
+    @classmethod
+    def _load_schema_file(cls, db_name: str, table_name: str, schema_file: str) -> Optional[List[Dict]]:
+        """Read one schema file into display form, or None if missing/unusable"""
+        # Reuse the parsed schema while the file is unchanged
+        try:
+            mtime = os.stat(schema_file).st_mtime_ns
+            cached = cls._schema_cache.get(schema_file)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            schema_data = _json_loads(Path(schema_file).read_bytes())
+        except FileNotFoundError:
+            schema_data = None
+        
+        if schema_data is not None:
+            # Convert to consistent format
+            schema = []
+            if 'columns' in schema_data:
+                for col_name, col_info in schema_data['columns'].items():
+                    # Fix: Get proper dtype from the schema
+                    dtype_str = col_info.get('dtype_str', col_info.get('dtype', 'VARCHAR'))
+                    
+                    # Normalize on the base type name, e.g. VARCHAR(50) -> VARCHAR
+                    base = dtype_str.split('(', 1)[0].strip().upper()
+                    if base == 'VARCHAR':
+                        # Keep the declared length if available
+                        actual_type = dtype_str if '(' in dtype_str else 'VARCHAR(255)'
+                    else:
+                        actual_type = _TYPE_CANON.get(base, dtype_str)
+                    
+                    schema.append({
+                        "name": col_name,
+                        "type": actual_type,
+                        "primary_key": col_info.get('primary_key', False),
+                        "unique": col_info.get('unique', False),
+                        "nullable": not col_info.get('not_null', False),
+                        "encrypted": col_info.get('encrypted', False),
+                        "default": col_info.get('default')
+                    })
+                log.debug("✅ Got schema from file: %s columns", len(schema))
+                if len(cls._schema_cache) >= cls._SCHEMA_CACHE_MAX:
+                    cls._prune_schema_cache()
+                cls._schema_cache[schema_file] = (mtime, schema)
+                return schema
+        return None
+    
+    @classmethod
+    async def get_all_schemas(cls, db_name="default") -> Dict[str, List[Dict]]:
+        """Schemas of every table, listed from the table cache and read concurrently"""
+        data_dir = _data_dir(db_name)
+        tables = await run_blocking(cls._scan_tables, db_name)
+        schema_files = [(table_name, os.path.join(data_dir, f"{table_name}{SCHEMA_SUFFIX}"))
+                        for table_name in tables]
+        
+        schemas = await asyncio.gather(
+            *(run_blocking(cls._load_schema_file, db_name, table_name, path)
+              for table_name, path in schema_files),
+            return_exceptions=True
+        )
+        return {
+            table_name: schema
+            for (table_name, _), schema in zip(schema_files, schemas)
+            if isinstance(schema, list)
+        }
+    
     @classmethod
     def get_table_schema(cls, table_name: str, db_name="default"):
         """Get schema for a specific table"""
         try:
-            print(f"📋 Getting schema for table: {db_name}.{table_name}")
+            log.debug("📋 Getting schema for table: %s.%s", db_name, table_name)
             
             # Method 1: Read schema from file
             try:
-                db_path = os.path.join(BASE_DIR, f"{db_name}.maldb")
-                data_dir = db_path.replace('.maldb', '_data')
-                schema_file = os.path.join(data_dir, f"{table_name}_schema.json")
+                data_dir = _data_dir(db_name)
+                schema_file = os.path.join(data_dir, f"{table_name}{SCHEMA_SUFFIX}")
                 
-                if os.path.exists(schema_file):
-                    with open(schema_file, 'r') as f:
-                        schema_data = json.load(f)
-                    
-                    # Convert to consistent format
-                    schema = []
-                    if 'columns' in schema_data:
-                        for col_name, col_info in schema_data['columns'].items():
-                            # Fix: Get proper dtype from the schema
-                            dtype_str = col_info.get('dtype_str', col_info.get('dtype', 'VARCHAR'))
-                            
-                            # Check if it's actually an INT or other type
-                            if dtype_str.startswith('INT'):
-                                actual_type = 'INT'
-                            elif dtype_str.startswith('VARCHAR'):
-                                # Extract length if available
-                                if '(' in dtype_str:
-                                    actual_type = dtype_str
-                                else:
-                                    actual_type = 'VARCHAR(255)'
-                            elif dtype_str.startswith('TEXT'):
-                                actual_type = 'TEXT'
-                            elif dtype_str.startswith('DECIMAL'):
-                                actual_type = 'DECIMAL(10,2)'
-                            elif dtype_str.startswith('BOOLEAN') or dtype_str.startswith('BOOL'):
-                                actual_type = 'BOOLEAN'
-                            else:
-                                actual_type = dtype_str
-                            
-                            schema.append({
-                                "name": col_name,
-                                "type": actual_type,
-                                "primary_key": col_info.get('primary_key', False),
-                                "unique": col_info.get('unique', False),
-                                "nullable": not col_info.get('not_null', False),
-                                "encrypted": col_info.get('encrypted', False),
-                                "default": col_info.get('default')
-                            })
-                        print(f"✅ Got schema from file: {len(schema)} columns")
-                        return schema
+                schema = cls._load_schema_file(db_name, table_name, schema_file)
+                if schema is not None:
+                    return schema
             except Exception as e:
-                print(f"Could not read schema file for {db_name}.{table_name}: {e}")
+                log.warning("Could not read schema file for %s.%s: %s", db_name, table_name, e)
             
             # Method 2: Try to get from catalog
             try:
@@ -522,134 +815,216 @@ class DatabaseManager:
                             "encrypted": col.encrypted,
                             "default": None
                         })
-                    print(f"✅ Got schema from catalog: {len(schema)} columns")
+                    log.debug("✅ Got schema from catalog: %s columns", len(schema))
                     return schema
             except Exception as e:
-                print(f"Could not get schema from catalog for {db_name}.{table_name}: {e}")
+                log.warning("Could not get schema from catalog for %s.%s: %s", db_name, table_name, e)
             
-            print(f"❌ No schema found for {db_name}.{table_name}")
+            log.debug("❌ No schema found for %s.%s", db_name, table_name)
             return []
             
         except Exception as e:
-            print(f"❌ Error getting schema for {db_name}.{table_name}: {e}")
-            traceback.print_exc()
+            log.exception("❌ Error getting schema for %s.%s: %s", db_name, table_name, e)
             return []
 
 # WebSocket manager for real-time updates
 class ConnectionManager:
+    # Clients are spread over shards so fan-out never walks one huge dict
+    NUM_SHARDS = 16
+    # Frames buffered per client; a client whose buffer fills up is dropped
+    OUTBOUND_BUFFER = 128
+    # A client that cannot take a frame within this many seconds is dropped
+    SEND_TIMEOUT = 5.0
+    # Messages queued within this window go out as one "batch" frame
+    COALESCE_WINDOW = 0.01
+    MAX_COALESCED = 64
+    
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Each client maps to its outbound queue and the writer task draining it
+        self.shards: List[Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]]] = [
+            {} for _ in range(self.NUM_SHARDS)
+        ]
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+    
+    def _shard(self, websocket: WebSocket) -> Dict:
+        return self.shards[id(websocket) % self.NUM_SHARDS]
+    
+    @property
+    def connection_count(self) -> int:
+        return sum(len(shard) for shard in self.shards)
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        outbound = asyncio.Queue(self.OUTBOUND_BUFFER)
+        writer = asyncio.create_task(self._writer(websocket, outbound))
+        self._shard(websocket)[websocket] = (outbound, writer)
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        entry = self._shard(websocket).pop(websocket, None)
+        if entry is not None and entry[1] is not asyncio.current_task():
+            entry[1].cancel()
+    
+    async def _writer(self, websocket: WebSocket, outbound: asyncio.Queue):
+        """Drain one client's queue; any send failure or stall evicts the client"""
+        try:
+            while True:
+                message = await outbound.get()
+                await asyncio.wait_for(websocket.send_text(message), self.SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.debug("Dropping WebSocket client: %s", e)
+            self.disconnect(websocket)
+    
+    def _enqueue(self, websocket: WebSocket, outbound: asyncio.Queue, message: str) -> bool:
+        """Buffer a frame for one client, evicting it if its buffer is full"""
+        try:
+            outbound.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            log.debug("Dropping slow WebSocket client")
+            self.disconnect(websocket)
+            return False
     
     async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+        entry = self._shard(websocket).get(websocket)
+        if entry is not None:
+            self._enqueue(websocket, entry[0], message)
     
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        """Queue a message; the flusher task sends queued messages together"""
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+        self._queue.put_nowait(message)
+    
+    async def _flush_loop(self):
+        """Coalesce queued messages into one frame per window"""
+        while True:
+            messages = [await self._queue.get()]
+            await asyncio.sleep(self.COALESCE_WINDOW)
+            while len(messages) < self.MAX_COALESCED and not self._queue.empty():
+                messages.append(self._queue.get_nowait())
+            
+            if len(messages) == 1:
+                self._send_all(messages[0])
+            else:
+                self._send_all(_json_dumps({"type": "batch", "items": messages}))
+    
+    async def stop(self):
+        """Cancel the flusher and every client writer"""
+        tasks = [writer for shard in self.shards for _, writer in shard.values()]
+        for shard in self.shards:
+            shard.clear()
+        if self._flusher is not None:
+            tasks.append(self._flusher)
+            self._flusher = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _send_all(self, message: str):
+        """Hand the same message to every client's writer without waiting on any of them"""
+        for shard in self.shards:
+            for websocket, (outbound, _) in tuple(shard.items()):
+                self._enqueue(websocket, outbound, message)
 
 manager = ConnectionManager()
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Lifespan context manager"""
-    # Startup
-    print("🚀 Starting MALDB Interface...")
-    
-    # Initialize default database with sample data
+async def _recycle_idle_connections(interval: float = 60.0):
+    """Periodically close idle pooled connections"""
+    while True:
+        await asyncio.sleep(interval)
+        await run_blocking(DatabaseManager.recycle_idle)
+
+def _seed_sample_data():
+    """Create the default database's sample tables and rows if they are missing"""
     try:
-        print("📁 Initializing default database...")
+        log.debug("📁 Initializing default database...")
         
         # First, list existing databases
         databases = DatabaseManager.list_databases()
-        print(f"📋 Found {len(databases)} database(s): {[db['name'] for db in databases]}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("📋 Found %s database(s): %s", len(databases), [db['name'] for db in databases])
         
         # Get default database (will create if doesn't exist)
         db = DatabaseManager.get_db("default")
         
         # First check what tables already exist
         existing_tables = DatabaseManager.get_tables("default")
-        print(f"📊 Existing tables in default: {existing_tables}")
+        log.debug("📊 Existing tables in default: %s", existing_tables)
         
-        # Create sample tables if they don't exist
+        # Sample tables with their seed rows, one multi-row INSERT each
         sample_tables = [
-            ("users", "CREATE TABLE users (id INT PRIMARY KEY, username VARCHAR(50), email VARCHAR(100), password TEXT ENCRYPTED, age INT, is_active BOOLEAN)"),
-            ("products", "CREATE TABLE products (id INT PRIMARY KEY, name VARCHAR(100), description TEXT, price DECIMAL(10,2), category VARCHAR(50), in_stock BOOLEAN)"),
-            ("orders", "CREATE TABLE orders (id INT PRIMARY KEY, user_id INT, product_id INT, quantity INT, total DECIMAL(10,2), status VARCHAR(20))")
+            ("users",
+             "CREATE TABLE users (id INT PRIMARY KEY, username VARCHAR(50), email VARCHAR(100), password TEXT ENCRYPTED, age INT, is_active BOOLEAN)",
+             "INSERT INTO users VALUES (1, 'alice', 'alice@example.com', 'secret123', 25, true), "
+             "(2, 'bob', 'bob@company.com', 'mypassword', 30, true)"),
+            ("products",
+             "CREATE TABLE products (id INT PRIMARY KEY, name VARCHAR(100), description TEXT, price DECIMAL(10,2), category VARCHAR(50), in_stock BOOLEAN)",
+             "INSERT INTO products VALUES (1, 'Laptop', 'High-performance laptop', 999.99, 'Electronics', true), "
+             "(2, 'Mouse', 'Wireless mouse', 29.99, 'Electronics', true)"),
+            ("orders",
+             "CREATE TABLE orders (id INT PRIMARY KEY, user_id INT, product_id INT, quantity INT, total DECIMAL(10,2), status VARCHAR(20))",
+             "INSERT INTO orders VALUES (1, 1, 1, 2, 1999.98, 'completed'), (2, 2, 2, 1, 29.99, 'pending')")
         ]
         
-        for table_name, sql in sample_tables:
-            if table_name not in existing_tables:
-                try:
-                    print(f"🆕 Creating table: {table_name}")
-                    result = db.execute(sql)
-                    print(f"✅ Created table: {table_name}")
-                except Exception as e:
-                    print(f"⚠️ Could not create table {table_name}: {e}")
-            else:
-                print(f"📋 Table already exists: {table_name}")
-        
-        # Insert some sample data if tables are empty
-        for table_name, _ in sample_tables:
+        existing = set(existing_tables)
+        for table_name, create_sql, insert_sql in sample_tables:
             try:
-                # Instead of SELECT COUNT(*), try to select all and check length
-                # This works because the database doesn't support COUNT(*)
-                result = db.execute(f"SELECT * FROM {table_name}")
-                
-                count = 0
-                if result:
-                    count = len(result)
+                if table_name not in existing:
+                    log.debug("🆕 Creating table: %s", table_name)
+                    db.execute(create_sql)
+                    count = 0
+                else:
+                    count = db.count(table_name)
                 
                 if count == 0:
-                    # Table is empty, insert sample data
-                    if table_name == "users":
-                        insert_sql = [
-                            "INSERT INTO users VALUES (1, 'alice', 'alice@example.com', 'secret123', 25, true)",
-                            "INSERT INTO users VALUES (2, 'bob', 'bob@company.com', 'mypassword', 30, true)"
-                        ]
-                    elif table_name == "products":
-                        insert_sql = [
-                            "INSERT INTO products VALUES (1, 'Laptop', 'High-performance laptop', 999.99, 'Electronics', true)",
-                            "INSERT INTO products VALUES (2, 'Mouse', 'Wireless mouse', 29.99, 'Electronics', true)"
-                        ]
-                    elif table_name == "orders":
-                        insert_sql = [
-                            "INSERT INTO orders VALUES (1, 1, 1, 2, 1999.98, 'completed')",
-                            "INSERT INTO orders VALUES (2, 2, 2, 1, 29.99, 'pending')"
-                        ]
-                    
-                    for sql in insert_sql:
-                        try:
-                            db.execute(sql)
-                            print(f"✅ Inserted sample data into {table_name}")
-                        except Exception as e:
-                            print(f"⚠️ Could not insert into {table_name}: {e}")
+                    db.execute(insert_sql)
+                    log.debug("✅ Inserted sample data into %s", table_name)
                 else:
-                    print(f"📊 {table_name} already has {count} rows")
+                    log.debug("📊 %s already has %s rows", table_name, count)
             except Exception as e:
-                print(f"⚠️ Could not check/insert data for {table_name}: {e}")
-                
-        print("✅ Database initialization complete")
+                log.warning("⚠️ Could not set up sample table %s: %s", table_name, e)
+        
+        log.info("✅ Database initialization complete")
         
     except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
-        traceback.print_exc()
+        log.exception("❌ Database initialization failed: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifespan context manager"""
+    global _db_pool
+    # Startup
+    _db_pool = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2, thread_name_prefix="maldb-db")
+    app.state.db_pool = _db_pool
+    log.info("🚀 Starting MALDB Interface...")
+    _bootstrap_static()
+    _hash_static_assets()
+    _preload_templates()
+    
+    # Seeding and prewarming execute SQL and hit disk; keep them off the event loop
+    await run_blocking(_seed_sample_data)
+    
+    # Keep other known databases warm and close ones nobody uses
+    await run_blocking(DatabaseManager.prewarm)
+    recycler = asyncio.create_task(_recycle_idle_connections())
     
     yield
     
     # Shutdown
-    print("🛑 Shutting down...")
+    log.info("🛑 Shutting down...")
+    recycler.cancel()
+    await manager.stop()
+    _db_pool.shutdown(wait=True)
+    _db_pool = None
     # Close all database connections
-    for name, db in DatabaseManager._connections.items():
+    for name, db in list(DatabaseManager._connections.items()):
         try:
             db.close()
-            print(f"Closed connection to {name}")
+            log.debug("Closed connection to %s", name)
         except:
             pass
 
@@ -661,31 +1036,171 @@ app = FastAPI(
     docs_url="/api/docs",  # Explicitly set docs URL
     redoc_url="/api/redoc",  # Explicitly set redoc URL
     openapi_url="/api/openapi.json",  # Explicitly set OpenAPI URL
+    default_response_class=ApiJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware
+# Origins allowed to call the API, comma-separated; defaults to the bundled UI
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get(
+        "MALDB_CORS_ORIGINS", "http://localhost:8081,http://127.0.0.1:8081"
+    ).split(",")
+    if origin.strip()
+]
+
+# Add CORS middleware; explicit lists let browsers cache preflights for max_age seconds
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allows all origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],  # Allows all methods
-    allow_headers=["*"],  # Allows all headers
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type", "if-none-match"],
+    max_age=600,
 )
 
-# Create directories if they don't exist
+class RequestDatabaseScope:
+    """ASGI middleware giving each HTTP request its own cache of Database handles"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_dbs.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_dbs.reset(token)
+
+app.add_middleware(RequestDatabaseScope)
+
 static_dir = os.path.join(BASE_DIR, "static")
 templates_dir = os.path.join(BASE_DIR, "templates")
+# Present once the directories and fallback assets have been set up
+STATIC_READY_SENTINEL = Path(static_dir) / ".ready"
+
+def _bootstrap_static():
+    """Create the static/template directories and fallback assets on first start only"""
+    if STATIC_READY_SENTINEL.exists():
+        return
+    os.makedirs(static_dir, exist_ok=True)
+    os.makedirs(templates_dir, exist_ok=True)
+    
+    if not os.path.exists(os.path.join(static_dir, "style.css")):
+        log.warning("⚠️  Static files not found, creating basic static files...")
+        try:
+            with open(os.path.join(static_dir, "style.css"), "w") as f:
+                f.write("/* Basic styles */")
+            with open(os.path.join(static_dir, "script.js"), "w") as f:
+                f.write("// Basic script")
+        except OSError as e:
+            log.error("❌ Could not create static files: %s", e)
+            return
+    STATIC_READY_SENTINEL.touch()
+
+# Versioned asset URLs change whenever the file does, so browsers may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STATIC_ASSETS = ("style.css", "script.js")
+STATIC_VERSIONS: Dict[str, str] = {}
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles that marks ?v= requests as immutable"""
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and scope.get("query_string", b"").startswith(b"v="):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+def _hash_static_assets():
+    """Fingerprint the page's CSS/JS once so templates can link versioned URLs"""
+    for name in STATIC_ASSETS:
+        try:
+            digest = hashlib.md5(Path(static_dir, name).read_bytes()).hexdigest()[:12]
+        except OSError:
+            continue
+        STATIC_VERSIONS[name] = digest
+
+def static_url(name: str) -> str:
+    """URL for a static asset, versioned by content when it has been fingerprinted"""
+    version = STATIC_VERSIONS.get(name)
+    return f"/static/{name}?v={version}" if version else f"/static/{name}"
+
+# Directories are created in lifespan, so the mount must not check at import
+app.mount("/static", VersionedStaticFiles(directory=static_dir, check_dir=False), name="static")
+
+# Templates are compiled once; auto_reload=False skips the per-render mtime check
+_jinja_env = Environment(
+    loader=FileSystemLoader(templates_dir),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1
+)
+_jinja_env.globals["static_url"] = static_url
+TEMPLATE_NAMES = ("index.html",)
+TEMPLATES: Dict[str, Template] = {}
+
+def _preload_templates():
+    """Compile every page template ahead of the first request"""
+    for name in TEMPLATE_NAMES:
+        TEMPLATES[name] = _jinja_env.get_template(name)
+
+# Statements that change the table list; only the head of the SQL is upper-cased
+_DDL_PREFIXES = ("CREATE TABLE", "DROP TABLE")
+_DDL_HEAD_LEN = max(map(len, _DDL_PREFIXES))
+
+# Results larger than this are streamed in row batches instead of one JSON body
+STREAM_ROWS_THRESHOLD = 10_000
+STREAM_BATCH_ROWS = 1_000
+
+# Most rows /api/execute returns for a SELECT; /api/execute/stream is unbounded
+_MAX_API_ROWS = int(os.environ.get("MALDB_MAX_API_ROWS", "100000"))
+
+def _dump_json(value) -> str:
+    """Compact JSON matching ApiJSONResponse's encoding"""
+    return _json_dumps(value)
+
+def _iter_result_json(payload: Dict):
+    """Yield a query payload as JSON text, encoding the rows a batch at a time"""
+    rows = payload["result"]
+    head = {key: value for key, value in payload.items() if key != "result"}
+    yield _dump_json(head)[:-1] + ',"result":['
+    for start in range(0, len(rows), STREAM_BATCH_ROWS):
+        batch = _dump_json(rows[start:start + STREAM_BATCH_ROWS])[1:-1]
+        yield batch if start == 0 else "," + batch
+    yield "]}"
 
-# Create directories if they don't exist
-os.makedirs(static_dir, exist_ok=True)
-os.makedirs(templates_dir, exist_ok=True)
+def _cached_json(request: Request, etag: Optional[str], payload: Dict):
+    """JSON response carrying an ETag, or an empty 304 if the client's copy is current"""
+    if etag is None:
+        return ApiJSONResponse(payload)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=1"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ApiJSONResponse(payload, headers=headers)
 
-# Mount static files from existing directory
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+def _databases_etag(databases: List[Dict], current_db: str) -> str:
+    """Validator for a database listing; table counts and sizes are part of it"""
+    digest = hash((current_db, tuple((db["name"], db["tables"], db["size"]) for db in databases)))
+    return f'W/"{digest & 0xFFFFFFFFFFFFFFFF:x}"'
 
-# Templates
-templates = Jinja2Templates(directory=templates_dir)
+# Last rendered home page, as (render inputs, encoded body)
+_home_page: Optional[Tuple[Tuple, bytes]] = None
+
+def _render_home(current_db: str, tables: List[str], databases: List[Dict]) -> bytes:
+    """Home page bytes, re-rendered only when the database or table listing changes"""
+    global _home_page
+    key = (current_db, tuple(tables), _databases_etag(databases, current_db))
+    if _home_page is None or _home_page[0] != key:
+        body = TEMPLATES["index.html"].render(
+            tables=tables,
+            databases=databases,
+            current_db=current_db
+        ).encode("utf-8")
+        _home_page = (key, body)
+    return _home_page[1]
 
 # Routes
 @app.get("/", response_class=HTMLResponse)
@@ -693,15 +1208,13 @@ async def home(request: Request):
     """Main interface"""
     # Get current database and all databases
     current_db = DatabaseManager.get_current_db()
-    databases = DatabaseManager.list_databases()
-    tables = DatabaseManager.get_tables(current_db)
+    # Both are blocking directory scans; run them side by side off the event loop
+    databases, tables = await asyncio.gather(
+        run_blocking(DatabaseManager.list_databases),
+        run_blocking(DatabaseManager.get_tables, current_db)
+    )
     
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "tables": tables,
-        "databases": databases,
-        "current_db": current_db
-    })
+    return HTMLResponse(_render_home(current_db, tables, databases))
 
 @app.get("/api/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
@@ -729,46 +1242,74 @@ async def api_execute(request: Request):
         db_name = data.get("database", DatabaseManager.get_current_db())
         
         if not sql:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": False,
                 "error": "No SQL query provided"
             }, status_code=400)
         
-        print(f"🌐 API: Executing SQL on {db_name}")
-        result = DatabaseManager.execute_query(sql, db_name)
+        log.debug("🌐 API: Executing SQL on %s", db_name)
+        result = await DatabaseManager.execute_query(sql, db_name, data.get("params"), _MAX_API_ROWS)
         
         # Update table list after certain operations
-        sql_upper = sql.upper()  # FIXED: Changed toUpperCase() to upper()
-        if sql_upper.startswith("CREATE TABLE") or sql_upper.startswith("DROP TABLE"):
+        head = sql.lstrip()[:_DDL_HEAD_LEN].upper()
+        if head.startswith(_DDL_PREFIXES):
             # Refresh table list
-            tables = DatabaseManager.get_tables(db_name)
+            tables = await run_blocking(DatabaseManager.get_tables, db_name)
             result["tables_updated"] = tables
+            DatabaseManager.invalidate_database_list()
         
-        return JSONResponse(result)
+        if result.get("affected_rows", 0) > STREAM_ROWS_THRESHOLD:
+            return StreamingResponse(_iter_result_json(result), media_type="application/json")
+        return ApiJSONResponse(result)
     except Exception as e:
-        print(f"❌ API Execute Error: {e}")
-        return JSONResponse({
+        log.error("❌ API Execute Error: %s", e)
+        return ApiJSONResponse({
+            "success": False,
+            "error": str(e)
+        }, status_code=500)
+
+@app.post("/api/execute/stream")
+async def api_execute_stream(request: Request):
+    """Execute SQL query and stream the rows as NDJSON"""
+    try:
+        data = await request.json()
+        sql = data.get("sql", "").strip()
+        db_name = data.get("database", DatabaseManager.get_current_db())
+        
+        if not sql:
+            return ApiJSONResponse({
+                "success": False,
+                "error": "No SQL query provided"
+            }, status_code=400)
+        
+        log.debug("🌐 API: Streaming SQL on %s", db_name)
+        return StreamingResponse(
+            DatabaseManager.stream_query(sql, db_name, data.get("params")),
+            media_type="application/x-ndjson"
+        )
+    except Exception as e:
+        log.error("❌ API Execute Stream Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e)
         }, status_code=500)
 
 @app.get("/api/tables")
-async def api_tables():
+async def api_tables(request: Request):
     """List all tables in current database"""
     try:
         current_db = DatabaseManager.get_current_db()
-        print(f"🌐 API /api/tables for {current_db}")
-        tables = DatabaseManager.get_tables(current_db)
-        print(f"📊 API returning tables for {current_db}: {tables}")
-        return JSONResponse({
+        log.debug("🌐 API /api/tables for %s", current_db)
+        tables = await run_blocking(DatabaseManager.get_tables, current_db)
+        log.debug("📊 API returning tables for %s: %s", current_db, tables)
+        return _cached_json(request, DatabaseManager.tables_etag(current_db), {
             "success": True,
             "tables": tables,
             "database": current_db
         })
     except Exception as e:
-        print(f"❌ API Tables Error: {e}")
-        traceback.print_exc()
-        return JSONResponse({
+        log.exception("❌ API Tables Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e),
             "tables": [],
@@ -776,19 +1317,19 @@ async def api_tables():
         }, status_code=500)
 
 @app.get("/api/tables/{db_name}")
-async def api_tables_for_db(db_name: str):
+async def api_tables_for_db(db_name: str, request: Request):
     """List all tables in specific database"""
     try:
-        print(f"🌐 API /api/tables/{db_name}")
-        tables = DatabaseManager.get_tables(db_name)
-        return JSONResponse({
+        log.debug("🌐 API /api/tables/%s", db_name)
+        tables = await run_blocking(DatabaseManager.get_tables, db_name)
+        return _cached_json(request, DatabaseManager.tables_etag(db_name), {
             "success": True,
             "tables": tables,
             "database": db_name
         })
     except Exception as e:
-        print(f"❌ API Tables Error for {db_name}: {e}")
-        return JSONResponse({
+        log.error("❌ API Tables Error for %s: %s", db_name, e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e),
             "tables": [],
@@ -796,45 +1337,88 @@ async def api_tables_for_db(db_name: str):
         }, status_code=500)
 
 @app.get("/api/schema/{table_name}")
-async def api_schema(table_name: str):
+async def api_schema(table_name: str, request: Request):
     """Get table schema"""
     try:
         current_db = DatabaseManager.get_current_db()
-        print(f"🌐 API /api/schema/{table_name} for {current_db}")
-        schema = DatabaseManager.get_table_schema(table_name, current_db)
+        log.debug("🌐 API /api/schema/%s for %s", table_name, current_db)
+        # File read and JSON decode happen off the event loop
+        schema = await run_blocking(DatabaseManager.get_table_schema, table_name, current_db)
         
-        return JSONResponse({
+        return _cached_json(request, DatabaseManager.schema_etag(table_name, current_db), {
             "success": True,
             "table": table_name,
             "schema": schema,
             "database": current_db
         })
     except Exception as e:
-        print(f"❌ API Schema Error for {table_name}: {e}")
-        return JSONResponse({
+        log.error("❌ API Schema Error for %s: %s", table_name, e)
+        return ApiJSONResponse({
+            "success": False,
+            "error": str(e)
+        }, status_code=500)
+
+@app.get("/api/schemas")
+async def api_all_schemas():
+    """Get schemas for every table in the current database"""
+    try:
+        current_db = DatabaseManager.get_current_db()
+        log.debug("🌐 API /api/schemas for %s", current_db)
+        schemas = await DatabaseManager.get_all_schemas(current_db)
+        
+        return ApiJSONResponse({
+            "success": True,
+            "schemas": schemas,
+            "database": current_db
+        })
+    except Exception as e:
+        log.error("❌ API Schemas Error: %s", e)
+        return ApiJSONResponse({
+            "success": False,
+            "error": str(e)
+        }, status_code=500)
+
+@app.get("/api/bootstrap")
+async def api_bootstrap():
+    """Databases, tables and schemas for the current database in one round trip"""
+    try:
+        current_db = DatabaseManager.get_current_db()
+        log.debug("🌐 API /api/bootstrap for %s", current_db)
+        databases, tables, schemas = await asyncio.gather(
+            run_blocking(DatabaseManager.list_databases),
+            run_blocking(DatabaseManager.get_tables, current_db),
+            DatabaseManager.get_all_schemas(current_db)
+        )
+        
+        return ApiJSONResponse({
+            "success": True,
+            "databases": databases,
+            "current": current_db,
+            "tables": tables,
+            "schemas": schemas
+        })
+    except Exception as e:
+        log.error("❌ API Bootstrap Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e)
         }, status_code=500)
 
 @app.get("/api/databases")
-async def api_databases():
+async def api_databases(request: Request):
     """List all databases"""
     try:
-        # Refresh the database list
-        DatabaseManager.refresh_databases()
-        
-        databases = DatabaseManager.list_databases()
+        databases = await run_blocking(DatabaseManager.list_databases)
         current_db = DatabaseManager.get_current_db()
-        print(f"🌐 API /api/databases: {len(databases)} databases, current: {current_db}")
-        return JSONResponse({
+        log.debug("🌐 API /api/databases: %s databases, current: %s", len(databases), current_db)
+        return _cached_json(request, _databases_etag(databases, current_db), {
             "success": True,
             "databases": databases,
             "current": current_db
         })
     except Exception as e:
-        print(f"❌ API Databases Error: {e}")
-        traceback.print_exc()
-        return JSONResponse({
+        log.exception("❌ API Databases Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e),
             "databases": []
@@ -848,29 +1432,28 @@ async def api_create_database(request: Request):
         db_name = data.get("name", "").strip()
         
         if not db_name:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": False,
                 "error": "No database name provided"
             }, status_code=400)
         
-        print(f"🌐 API /api/databases/create: {db_name}")
-        success, message = DatabaseManager.create_database(db_name)
+        log.debug("🌐 API /api/databases/create: %s", db_name)
+        success, message = await run_blocking(DatabaseManager.create_database, db_name)
         
         if success:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": True,
                 "message": message,
                 "database": db_name
             })
         else:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": False,
                 "error": message
             }, status_code=400)
     except Exception as e:
-        print(f"❌ API Create Database Error: {e}")
-        traceback.print_exc()
-        return JSONResponse({
+        log.exception("❌ API Create Database Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e)
         }, status_code=500)
@@ -883,38 +1466,36 @@ async def api_switch_database(request: Request):
         db_name = data.get("name", "").strip()
         
         if not db_name:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": False,
                 "error": "No database name provided"
             }, status_code=400)
         
-        print(f"🌐 API /api/databases/switch: {db_name}")
+        log.debug("🌐 API /api/databases/switch: %s", db_name)
         
         # Get the database (this will create it if needed)
         try:
-            db = DatabaseManager.get_db(db_name)
+            db = await run_blocking(DatabaseManager.get_db, db_name)
             DatabaseManager.set_current_db(db_name)
             
             # Get tables for the new database
-            tables = DatabaseManager.get_tables(db_name)
+            tables = await run_blocking(DatabaseManager.get_tables, db_name)
             
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": True,
                 "message": f"Switched to database '{db_name}'",
                 "database": db_name,
                 "tables": tables
             })
         except Exception as e:
-            print(f"❌ Error switching to database {db_name}: {e}")
-            traceback.print_exc()
-            return JSONResponse({
+            log.exception("❌ Error switching to database %s: %s", db_name, e)
+            return ApiJSONResponse({
                 "success": False,
                 "error": f"Could not switch to database '{db_name}': {str(e)}"
             }, status_code=400)
     except Exception as e:
-        print(f"❌ API Switch Database Error: {e}")
-        traceback.print_exc()
-        return JSONResponse({
+        log.exception("❌ API Switch Database Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e)
         }, status_code=500)
@@ -923,23 +1504,22 @@ async def api_switch_database(request: Request):
 async def api_delete_database(db_name: str):
     """Delete a database"""
     try:
-        print(f"🌐 API /api/databases/{db_name} DELETE")
-        success, message = DatabaseManager.delete_database(db_name)
+        log.debug("🌐 API /api/databases/%s DELETE", db_name)
+        success, message = await run_blocking(DatabaseManager.delete_database, db_name)
         
         if success:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": True,
                 "message": message
             })
         else:
-            return JSONResponse({
+            return ApiJSONResponse({
                 "success": False,
                 "error": message
             }, status_code=400)
     except Exception as e:
-        print(f"❌ API Delete Database Error: {e}")
-        traceback.print_exc()
-        return JSONResponse({
+        log.exception("❌ API Delete Database Error: %s", e)
+        return ApiJSONResponse({
             "success": False,
             "error": str(e)
         }, status_code=500)
@@ -952,58 +1532,90 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             data = await websocket.receive_text()
             # Echo back for now
-            await websocket.send_text(f"Message received: {data}")
+            await manager.send_personal_message(f"Message received: {data}", websocket)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
+# Parts of /api/info that never change
+_INFO_STATIC = {
+    "name": "MALDB API",
+    "version": "1.0.0",
+    "description": "Minimal Relational Database Management System",
+    "endpoints": {
+        "POST /api/execute": "Execute SQL query",
+        "POST /api/execute/stream": "Execute SQL query, rows streamed as NDJSON",
+        "GET /api/tables": "List all tables in current database",
+        "GET /api/tables/{db_name}": "List all tables in specific database",
+        "GET /api/schema/{table_name}": "Get table schema",
+        "GET /api/schemas": "Get schemas for all tables in current database",
+        "GET /api/bootstrap": "Databases, tables and schemas in one response",
+        "GET /api/databases": "List all databases",
+        "POST /api/databases/create": "Create new database",
+        "POST /api/databases/switch": "Switch database",
+        "DELETE /api/databases/{db_name}": "Delete database",
+        "GET /api/health": "Health check",
+        "GET /api/docs": "API documentation",
+        "GET /": "Web interface"
+    },
+    "features": [
+        "SQL CREATE, INSERT, SELECT, UPDATE, DELETE",
+        "Column-level AES-GCM encryption",
+        "JOIN operations",
+        "Constraint enforcement",
+        "Single-command SQL parser",
+        "Multiple database support"
+    ]
+}
+
+# /health timestamp, refreshed at most once per _HEALTH_STAMP_TTL seconds
+_HEALTH_STAMP_TTL = 1.0
+_health_stamp: Tuple[float, str] = (float("-inf"), "")
+
 @app.get("/health")
 async def health():
     """Health check"""
-    return {
+    global _health_stamp
+    now = time.monotonic()
+    if now - _health_stamp[0] >= _HEALTH_STAMP_TTL:
+        _health_stamp = (now, datetime.now().isoformat())
+    return ApiJSONResponse({
         "status": "healthy",
         "service": "maldb",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _health_stamp[1],
         "version": "1.0.0",
         "current_database": DatabaseManager.get_current_db()
-    }
+    })
 
 @app.get("/api/info")
 async def api_info():
     """Get API information"""
     current_db = DatabaseManager.get_current_db()
-    databases = DatabaseManager.list_databases()
+    databases = await run_blocking(DatabaseManager.list_databases)
     
-    return {
-        "name": "MALDB API",
-        "version": "1.0.0",
-        "description": "Minimal Relational Database Management System",
+    return ApiJSONResponse({
+        **_INFO_STATIC,
         "current_database": current_db,
-        "total_databases": len(databases),
-        "endpoints": {
-            "POST /api/execute": "Execute SQL query",
-            "GET /api/tables": "List all tables in current database",
-            "GET /api/tables/{db_name}": "List all tables in specific database",
-            "GET /api/schema/{table_name}": "Get table schema",
-            "GET /api/databases": "List all databases",
-            "POST /api/databases/create": "Create new database",
-            "POST /api/databases/switch": "Switch database",
-            "DELETE /api/databases/{db_name}": "Delete database",
-            "GET /api/health": "Health check",
-            "GET /api/docs": "API documentation",
-            "GET /": "Web interface"
-        },
-        "features": [
-            "SQL CREATE, INSERT, SELECT, UPDATE, DELETE",
-            "Column-level AES-GCM encryption",
-            "JOIN operations",
-            "Constraint enforcement",
-            "Single-command SQL parser",
-            "Multiple database support"
-        ]
-    }
+        "total_databases": len(databases)
+    })
+
+def _start_log_listener() -> QueueListener:
+    """Route demo logging through a queue so handler I/O runs off the event loop"""
+    log_queue = queue.SimpleQueue()
+    # QueueHandler formats the record before enqueueing; the listener only writes it
+    logging.basicConfig(
+        level=os.environ.get("MALDB_LOG_LEVEL", "WARNING").upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        handlers=[QueueHandler(log_queue)]
+    )
+    listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 def start_web_interface():
     """Start the web interface"""
+    _start_log_listener()
+    
     print("\n" + "=" * 60)
     print("🚀 MALDB Professional Interface")
     print("=" * 60)
@@ -1030,20 +1642,8 @@ def start_web_interface():
     print("   • orders")
     print("=" * 60)
     
-    # Check if static files exist
-    if not os.path.exists(os.path.join(static_dir, "style.css")):
-        print("\n⚠️  WARNING: Static files not found!")
-        print("   Creating basic static files...")
-        # Create basic static files if they don't exist
-        try:
-            with open(os.path.join(static_dir, "style.css"), "w") as f:
-                f.write("/* Basic styles */")
-            with open(os.path.join(static_dir, "script.js"), "w") as f:
-                f.write("// Basic script")
-        except:
-            pass
-    
-    uvicorn.run(app, host="0.0.0.0", port=8081)
+    # Connections, caches and the WebSocket hub live in this process, so stay on one worker
+    uvicorn.run(app, host="0.0.0.0", port=8081, log_level="warning", access_log=False, **uvicorn_fast_path())
 
 if __name__ == "__main__":
     start_web_interface()
\ No newline at end of file
@@ -1,4 +1,10 @@
 // MALDB Professional Interface - JavaScript with Multi-Database Support
+
+// Escaping runs once per result cell, so use one regex pass instead of a DOM round-trip
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;' };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+const escapeHtmlChar = (ch) => HTML_ESCAPES[ch];
+
 class MALDBInterface {
     constructor() {
         this.currentPage = 'query';
@@ -270,8 +276,8 @@ class MALDBInterface {
             return;
         }
         
-        // Build table HTML
-        let tableHTML = dbInfo + '<div class="result-header">' +
+        // Build table HTML as parts and join once; += on a large result is quadratic
+        const parts = [dbInfo + '<div class="result-header">' +
                        '<div class="result-stats">' +
                        '<div class="stat-item success">' +
                        '<span class="status-indicator status-online"></span>' +
@@ -279,60 +285,55 @@ class MALDBInterface {
                        '</div>' +
                        '<div class="stat-item">' +
                        result.affected_rows + ' row' + (result.affected_rows !== 1 ? 's' : '') + ' returned' +
+                       (result.truncated ? ' (truncated)' : '') +
                        '</div>' +
                        '</div>' +
                        '</div>' +
                        '<div class="table-responsive">' +
                        '<table class="result-table">' +
                        '<thead>' +
-                       '<tr>';
+                       '<tr>'];
         
         // Add headers
         if (result.columns && result.columns.length > 0) {
-            result.columns.forEach(column => {
-                tableHTML += '<th>' + this.escapeHtml(column) + '</th>';
-            });
+            for (const column of result.columns) {
+                parts.push('<th>' + this.escapeHtml(column) + '</th>');
+            }
         } else if (result.result && result.result.length > 0) {
             // If no column names, use generic ones
             const firstRow = result.result[0];
             if (Array.isArray(firstRow)) {
                 for (let i = 0; i < firstRow.length; i++) {
-                    tableHTML += '<th>Column ' + (i + 1) + '</th>';
+                    parts.push('<th>Column ' + (i + 1) + '</th>');
                 }
             } else if (typeof firstRow === 'object') {
-                Object.keys(firstRow).forEach(key => {
-                    tableHTML += '<th>' + this.escapeHtml(key) + '</th>';
-                });
+                for (const key of Object.keys(firstRow)) {
+                    parts.push('<th>' + this.escapeHtml(key) + '</th>');
+                }
             }
         }
         
-        tableHTML += '</tr>' +
-                    '</thead>' +
-                    '<tbody>';
+        parts.push('</tr>' +
+                   '</thead>' +
+                   '<tbody>');
         
         // Add rows
-        result.result.forEach(row => {
-            tableHTML += '<tr>';
-            if (Array.isArray(row)) {
-                row.forEach(cell => {
-                    tableHTML += '<td>' + this.escapeHtml(String(cell)) + '</td>';
-                });
-            } else if (typeof row === 'object') {
-                // Handle object rows
-                Object.values(row).forEach(cell => {
-                    tableHTML += '<td>' + this.escapeHtml(String(cell)) + '</td>';
-                });
-            } else {
-                tableHTML += '<td>' + this.escapeHtml(String(row)) + '</td>';
+        for (const row of result.result) {
+            parts.push('<tr>');
+            const cells = Array.isArray(row) ? row
+                        : (typeof row === 'object' ? Object.values(row) : [row]);
+            for (const cell of cells) {
+                // Numbers and booleans need no escaping; null still shows as "null"
+                parts.push('<td>' + (cell === null ? 'null' : this.escapeHtml(cell)) + '</td>');
             }
-            tableHTML += '</tr>';
-        });
+            parts.push('</tr>');
+        }
         
-        tableHTML += '</tbody>' +
-                    '</table>' +
-                    '</div>';
+        parts.push('</tbody>' +
+                   '</table>' +
+                   '</div>');
         
-        container.innerHTML = tableHTML;
+        container.innerHTML = parts.join('');
     }
     
     displayError(error) {
@@ -465,6 +466,13 @@ class MALDBInterface {
         
         try {
             console.log(`Loading tables for database: ${this.currentDatabase}`);
+            // All schemas in one request instead of one /api/schema call per table
+            const schemasRequest = fetch('/api/schemas')
+                .then(r => r.json())
+                .catch(schemaError => {
+                    console.error('Error loading schemas:', schemaError);
+                    return {};
+                });
             const response = await fetch('/api/tables');
             const data = await response.json();
             
@@ -486,87 +494,17 @@ class MALDBInterface {
                 return;
             }
             
-            let tablesHTML = `<div style="font-size: 12px; color: var(--text-tertiary); margin-bottom: 16px;">
-                Database: <strong>${this.escapeHtml(data.database || this.currentDatabase)}</strong> - ${data.tables.length} table${data.tables.length !== 1 ? 's' : ''}
-            </div>` +
-            '<div class="tables-grid">';
+            const schemaData = await schemasRequest;
+            const schemas = (schemaData.success && schemaData.schemas) || {};
             
+            const parts = [`<div style="font-size: 12px; color: var(--text-tertiary); margin-bottom: 16px;">
+                Database: <strong>${this.escapeHtml(data.database || this.currentDatabase)}</strong> - ${data.tables.length} table${data.tables.length !== 1 ? 's' : ''}
+            </div>`, '<div class="tables-grid">'];
             for (const tableName of data.tables) {
-                try {
-                    // Fetch actual schema for each table
-                    const schemaResponse = await fetch('/api/schema/' + encodeURIComponent(tableName));
-                    const schemaData = await schemaResponse.json();
-                    
-                    let schemaHTML = '';
-                    if (schemaData.success && schemaData.schema) {
-                        schemaData.schema.forEach(column => {
-                            schemaHTML += '<div class="schema-item">' +
-                                         '<span class="column-name">' + this.escapeHtml(column.name) + '</span>' +
-                                         '<span class="column-type">' +
-                                         '<span>' + column.type + '</span>' +
-                                         (column.encrypted ? '<span class="encrypted-badge">ENCRYPTED</span>' : '') +
-                                         (column.primary_key ? '<span style="color: var(--accent-green); font-size: 10px; margin-left: 4px;">PK</span>' : '') +
-                                         '</span>' +
-                                         '</div>';
-                        });
-                    } else {
-                        // Fallback schema
-                        schemaHTML = '<div class="schema-item">' +
-                                    '<span class="column-name">id</span>' +
-                                    '<span class="column-type">INT</span>' +
-                                    '</div>' +
-                                    '<div class="schema-item">' +
-                                    '<span class="column-name">name</span>' +
-                                    '<span class="column-type">VARCHAR(50)</span>' +
-                                    '</div>';
-                    }
-                    
-                    const escapedTableName = this.escapeHtml(tableName);
-                    const safeTableName = this.escapeSingleQuotes(tableName);
-                    
-                    tablesHTML += '<div class="table-card">' +
-                                 '<div class="table-header">' +
-                                 '<div class="table-name">' + escapedTableName + '</div>' +
-                                 '<div class="table-stats">' +
-                                 '<span class="badge badge-success">Active</span>' +
-                                 '</div>' +
-                                 '</div>' +
-                                 '<div class="table-schema">' +
-                                 schemaHTML +
-                                 '</div>' +
-                                 '<div style="margin-top: 16px; display: flex; gap: 8px;">' +
-                                 '<button class="toolbar-btn" onclick="maldb.insertIntoEditor(\'SELECT * FROM ' + safeTableName + '\')">' +
-                                 'Select All' +
-                                 '</button>' +
-                                 '<button class="toolbar-btn" onclick="maldb.insertIntoEditor(\'DROP TABLE ' + safeTableName + '\')" style="color: #f85149;">' +
-                                 'Drop Table' +
-                                 '</button>' +
-                                 '</div>' +
-                                 '</div>';
-                } catch (schemaError) {
-                    console.error('Error loading schema for ' + tableName + ':', schemaError);
-                    // Show table without schema
-                    const escapedTableName = this.escapeHtml(tableName);
-                    const safeTableName = this.escapeSingleQuotes(tableName);
-                    
-                    tablesHTML += '<div class="table-card">' +
-                                 '<div class="table-header">' +
-                                 '<div class="table-name">' + escapedTableName + '</div>' +
-                                 '<div class="table-stats">' +
-                                 '<span class="badge badge-success">Active</span>' +
-                                 '</div>' +
-                                 '</div>' +
-                                 '<div style="margin-top: 16px; display: flex; gap: 8px;">' +
-                                 '<button class="toolbar-btn" onclick="maldb.insertIntoEditor(\'SELECT * FROM ' + safeTableName + '\')">' +
-                                 'Select All' +
-                                 '</button>' +
-                                 '</div>' +
-                                 '</div>';
-                }
+                parts.push(this.renderTableCard(tableName, schemas[tableName]));
             }
-            
-            tablesHTML += '</div>';
-            container.innerHTML = tablesHTML;
+            parts.push('</div>');
+            container.innerHTML = parts.join('');
         } catch (error) {
             console.error('Error loading tables:', error);
             container.innerHTML = '<div class="error-message" style="text-align: center; padding: 40px;">' +
@@ -576,6 +514,45 @@ class MALDBInterface {
         }
     }
     
+    renderTableCard(tableName, schema) {
+        const escapedTableName = this.escapeHtml(tableName);
+        const safeTableName = this.escapeSingleQuotes(tableName);
+        const parts = ['<div class="table-card">' +
+                       '<div class="table-header">' +
+                       '<div class="table-name">' + escapedTableName + '</div>' +
+                       '<div class="table-stats">' +
+                       '<span class="badge badge-success">Active</span>' +
+                       '</div>' +
+                       '</div>'];
+        
+        if (schema) {
+            parts.push('<div class="table-schema">');
+            for (const column of schema) {
+                parts.push('<div class="schema-item">' +
+                           '<span class="column-name">' + this.escapeHtml(column.name) + '</span>' +
+                           '<span class="column-type">' +
+                           '<span>' + column.type + '</span>' +
+                           (column.encrypted ? '<span class="encrypted-badge">ENCRYPTED</span>' : '') +
+                           (column.primary_key ? '<span style="color: var(--accent-green); font-size: 10px; margin-left: 4px;">PK</span>' : '') +
+                           '</span>' +
+                           '</div>');
+            }
+            parts.push('</div>');
+        }
+        
+        parts.push('<div style="margin-top: 16px; display: flex; gap: 8px;">' +
+                   '<button class="toolbar-btn" onclick="maldb.insertIntoEditor(\'SELECT * FROM ' + safeTableName + '\')">' +
+                   'Select All' +
+                   '</button>');
+        if (schema) {
+            parts.push('<button class="toolbar-btn" onclick="maldb.insertIntoEditor(\'DROP TABLE ' + safeTableName + '\')" style="color: #f85149;">' +
+                       'Drop Table' +
+                       '</button>');
+        }
+        parts.push('</div>', '</div>');
+        return parts.join('');
+    }
+    
     async switchDatabase(dbName) {
         try {
             console.log(`Switching to database: ${dbName}`);
@@ -1027,9 +1004,8 @@ class MALDBInterface {
     
     escapeHtml(text) {
         if (text === null || text === undefined) return '';
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        if (typeof text === 'number' || typeof text === 'boolean') return String(text);
+        return String(text).replace(HTML_ESCAPE_RE, escapeHtmlChar);
     }
     
     escapeSingleQuotes(text) {
@@ -2,7 +2,10 @@
 """
 Example of integrating MALDB with a web application
 """
+import hashlib
+import os
 import sys
+import threading
 sys.path.insert(0, '.')
 
 from src.core.database import Database
@@ -12,12 +15,20 @@ class WebApp:
     
     def __init__(self, db_file="webapp.maldb"):
         self.db = Database(db_file)
+        self.db_file = db_file
+        self._id_lock = threading.Lock()
         self.setup_database()
+        
+        # INSERT shapes never change, so parse them once and only bind values per call
+        self._ins_user = self.db.prepare(
+            "INSERT INTO users (id, username, email, password_hash) VALUES (?, ?, ?, ?)")
+        self._ins_post = self.db.prepare(
+            "INSERT INTO posts (id, user_id, title, content, is_private) VALUES (?, ?, ?, ?, ?)")
     
     def setup_database(self):
         """Initialize database schema"""
         # Users table with encrypted password
-        self.db.execute("""
+        users_sql = """
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY,
                 username VARCHAR(50) UNIQUE NOT NULL,
@@ -26,10 +37,10 @@ class WebApp:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 is_active BOOLEAN DEFAULT TRUE
             )
-        """)
+        """
         
         # Posts table
-        self.db.execute("""
+        posts_sql = """
             CREATE TABLE IF NOT EXISTS posts (
                 id INTEGER PRIMARY KEY,
                 user_id INTEGER,
@@ -39,7 +50,41 @@ class WebApp:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users(id)
             )
-        """)
+        """
+        
+        # Skip the DDL when this exact schema was already applied to the file
+        schema_hash = hashlib.sha256((users_sql + posts_sql).encode()).hexdigest()
+        hash_file = self.db_file + '.schema_hash'
+        if self._read_schema_hash(hash_file) != schema_hash or not all(
+                self.db.catalog.table_exists(table) for table in ("users", "posts")):
+            self.db.execute(users_sql)
+            self.db.execute(posts_sql)
+            with open(hash_file, 'w') as f:
+                f.write(schema_hash)
+        
+        # Scan for the highest IDs once; inserts then just take the next counter value
+        self._next_user_id = self._max_id("users") + 1
+        self._next_post_id = self._max_id("posts") + 1
+    
+    @staticmethod
+    def _read_schema_hash(hash_file):
+        """Fingerprint of the last applied schema, or None if there is none"""
+        if not os.path.exists(hash_file):
+            return None
+        with open(hash_file) as f:
+            return f.read().strip()
+    
+    def _max_id(self, table):
+        """Highest id in a table, or 0 if it is empty"""
+        rows = self.db.execute(f"SELECT id FROM {table}")
+        return max(row[0] for row in rows) if rows else 0
+    
+    def _take_id(self, counter):
+        """Return the next value of an ID counter and advance it"""
+        with self._id_lock:
+            next_id = getattr(self, counter)
+            setattr(self, counter, next_id + 1)
+        return next_id
     
     def create_user(self, username, email, password):
         """Create a new user"""
@@ -47,31 +92,27 @@ class WebApp:
         import hashlib
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         
-        # Get next ID
-        users = self.db.execute("SELECT id FROM users")
-        next_id = max([u[0] for u in users]) + 1 if users else 1
+        next_id = self._take_id("_next_user_id")
         
-        self.db.execute(f"""
-            INSERT INTO users (id, username, email, password_hash)
-            VALUES ({next_id}, '{username}', '{email}', '{password_hash}')
-        """)
+        self._ins_user.execute((next_id, username, email, password_hash))
         
         return next_id
     
     def create_post(self, user_id, title, content, is_private=False):
         """Create a new post"""
-        posts = self.db.execute("SELECT id FROM posts")
-        next_id = max([p[0] for p in posts]) + 1 if posts else 1
+        next_id = self._take_id("_next_post_id")
         
-        private = 'TRUE' if is_private else 'FALSE'
-        
-        self.db.execute(f"""
-            INSERT INTO posts (id, user_id, title, content, is_private)
-            VALUES ({next_id}, {user_id}, '{title}', '{content}', {private})
-        """)
+        self._ins_post.execute((next_id, user_id, title, content, bool(is_private)))
         
         return next_id
     
+    def create_posts(self, posts):
+        """Create several posts in one insert; posts are (user_id, title, content, is_private)"""
+        rows = [(self._take_id("_next_post_id"), user_id, title, content, is_private)
+                for user_id, title, content, is_private in posts]
+        self.db.insert_many("posts", rows, columns=["id", "user_id", "title", "content", "is_private"])
+        return [row[0] for row in rows]
+    
     def get_user_posts(self, user_id):
         """Get all posts for a user"""
         return self.db.execute(f"""
@@ -108,9 +149,11 @@ def main():
     
     # Create posts
     print("\n2. Creating posts...")
-    app.create_post(alice_id, "My First Post", "Hello world!", is_private=False)
-    app.create_post(alice_id, "Private Thoughts", "Secret diary entry", is_private=True)
-    app.create_post(bob_id, "Bob's Blog", "Welcome to my blog!", is_private=False)
+    app.create_posts([
+        (alice_id, "My First Post", "Hello world!", False),
+        (alice_id, "Private Thoughts", "Secret diary entry", True),
+        (bob_id, "Bob's Blog", "Welcome to my blog!", False),
+    ])
     
     # Get user posts
     print("\n3. Retrieving public posts...")
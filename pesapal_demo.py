@@ -4,15 +4,18 @@ Complete demonstration for Pesapal Challenge Submission
 Shows all features working end-to-end
 """
 import os
+import re
 import sys
 import time
 
 # Set fixed encryption key for consistent demos (no warnings)
 os.environ['MALDB_MASTER_KEY'] = '0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef'
 
+_CLEAR_CMD = 'cls' if os.name == 'nt' else 'clear'
+
 def clear_screen():
     """Clear terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    os.system(_CLEAR_CMD)
 
 def print_header(title):
     """Print formatted header"""
@@ -20,16 +23,43 @@ def print_header(title):
     print(f"🧠 {title}")
     print("=" * 60)
 
+# Single-row INSERTs that can be merged into one multi-row statement
+_INSERT_VALUES_RE = re.compile(r"^\s*(INSERT\s+INTO\s+\w+\s+VALUES)\s*(\(.*\))\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+
+def coalesce_inserts(sql_commands):
+    """Merge runs of INSERTs into the same table so each run is parsed and written once"""
+    merged = []
+    run_key, run_head, run_values = None, None, []
+    for sql in sql_commands:
+        match = _INSERT_VALUES_RE.match(sql)
+        key = " ".join(match.group(1).split()).upper() if match else None
+        if key is None or key != run_key:
+            if run_values:
+                merged.append(f"{run_head} {', '.join(run_values)}")
+            run_key, run_head, run_values = key, match and match.group(1), []
+        if key is None:
+            merged.append(sql)
+        else:
+            run_values.append(match.group(2))
+    if run_values:
+        merged.append(f"{run_head} {', '.join(run_values)}")
+    return merged
+
 def demo_feature(title, description, sql_commands, delay=1.5):
     """Demonstrate a feature"""
     print_header(title)
     print(description)
     print("\n💻 Commands executed:")
     
+    # Strip and classify each command once for both loops below
+    stripped = [cmd.strip() for cmd in sql_commands]
+    is_comment = [cmd.startswith('--') for cmd in stripped]
+    notes = {cmd: text[2:].strip() for cmd, text, comment in zip(sql_commands, stripped, is_comment) if comment}
+    
     # Filter out comment lines for display
-    display_commands = [cmd for cmd in sql_commands if not cmd.strip().startswith('--')]
-    for sql in display_commands:
-        print(f"   $ {sql}")
+    for sql, comment in zip(sql_commands, is_comment):
+        if not comment:
+            print(f"   $ {sql}")
     
     print("\n📊 Result:")
     print("-" * 40)
@@ -40,10 +70,10 @@ def demo_feature(title, description, sql_commands, delay=1.5):
     # Use a fresh database for demo with silent encryption
     db = Database("demo.maldb")
     
-    for sql in sql_commands:
+    for sql in coalesce_inserts(sql_commands):
         # Skip comment lines (but print them as notes)
-        if sql.strip().startswith('--'):
-            print(f"   💡 {sql[2:].strip()}")
+        if sql in notes:
+            print(f"   💡 {notes[sql]}")
             continue
             
         try:
@@ -1,14 +1,26 @@
 """
 REST API server for MALDB
 """
+import asyncio
 import time
+from collections import OrderedDict
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Any
+from fastapi.responses import JSONResponse
+from typing import List, Any, Tuple
 from ..core.database import Database
 from ..core.exceptions import ParseError, ExecutionError
+from ..utils.helpers import uvicorn_fast_path
+from ..utils.locks import ReadWriteLock
 from .models import QueryRequest, QueryResponse, DatabaseInfo, TableInfo
 
+# orjson is optional; both encoders write row tuples as JSON arrays
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as ApiJSONResponse
+except ImportError:
+    ApiJSONResponse = JSONResponse
+
 app = FastAPI(title="MALDB API", version="0.1.0")
 
 # Add CORS middleware
@@ -20,8 +32,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global database instance
+# Global database instance, shared by all requests. Separate instances would each
+# hold their own catalog and miss tables created through another one, so
+# concurrency comes from running reads in threads under a shared lock instead.
 db_instance = None
+db_lock = ReadWriteLock()
+
+# Statements that only read; they may run alongside each other
+_READ_PREFIXES = ("SELECT", "EXPLAIN")
+_READ_HEAD_LEN = max(map(len, _READ_PREFIXES))
+
+# Results of recent SELECTs keyed by (SQL, parameters); any other statement clears it
+_query_cache: "OrderedDict[Tuple[str, str], List[Tuple]]" = OrderedDict()
+_CACHE_MAX = 512
 
 def start_api_server(port: int = 8000, db_file: str = "default.maldb"):
     """Start the API server"""
@@ -34,7 +57,8 @@ def start_api_server(port: int = 8000, db_file: str = "default.maldb"):
     print(f"Starting MALDB API server on http://localhost:{port}")
     print(f"API documentation: http://localhost:{port}/docs")
     
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Queries already run in worker threads; uvloop speeds up the loop dispatching them
+    uvicorn.run(app, host="0.0.0.0", port=port, **uvicorn_fast_path())
 
 @app.on_event("startup")
 async def startup_event():
@@ -64,17 +88,39 @@ async def execute_query(request: QueryRequest):
     
     start_time = time.time()
     
+    sql = request.sql.strip()
+    is_select = sql[:6].upper() == "SELECT"
+    key = (sql, repr(request.params))
+    lock = db_lock.read() if sql[:_READ_HEAD_LEN].upper().startswith(_READ_PREFIXES) else db_lock.write()
+    
     try:
-        result = db_instance.execute(request.sql)
-        
-        # Convert tuples to lists for JSON serialization
-        result_list = [list(row) for row in result]
+        result = _query_cache.get(key) if is_select else None
+        if result is not None:
+            _query_cache.move_to_end(key)
+        else:
+            # The cache is filled and cleared under the lock, so a result can
+            # never be stored after a write that made it stale
+            async with lock:
+                if not is_select:
+                    # Coarse invalidation: anything but a SELECT may change any table
+                    _query_cache.clear()
+                
+                # Keep the event loop free while the engine parses and reads files
+                result = await asyncio.to_thread(db_instance.execute, sql, request.params)
+                
+                # Rows are tuples, so the cached list can be shared between responses
+                if is_select:
+                    _query_cache[key] = result
+                    if len(_query_cache) > _CACHE_MAX:
+                        _query_cache.popitem(last=False)
         
-        return QueryResponse(
-            success=True,
-            result=result_list,
-            execution_time_ms=(time.time() - start_time) * 1000
-        )
+        # Encoded straight from the row tuples; QueryResponse still documents the shape
+        return ApiJSONResponse({
+            "success": True,
+            "result": result,
+            "error": None,
+            "execution_time_ms": (time.time() - start_time) * 1000
+        })
         
     except (ParseError, ExecutionError) as e:
         # These are expected errors from invalid SQL
@@ -93,6 +139,13 @@ async def execute_query(request: QueryRequest):
             execution_time_ms=(time.time() - start_time) * 1000
         )
 
+@app.post("/api/cache/flush")
+async def flush_query_cache():
+    """Drop all cached SELECT results"""
+    flushed = len(_query_cache)
+    _query_cache.clear()
+    return {"success": True, "flushed": flushed}
+
 @app.get("/tables", response_model=List[str])
 async def list_tables():
     """List all tables in the database"""
@@ -121,12 +174,12 @@ async def get_table_info(table_name: str):
         
         table = db_instance.catalog.tables[table_name]
         
-        # Get row count
-        rows = db_instance.file_manager.get_all_rows(table_name)
-        row_count = len(rows)
+        # Row count is cached by storage; only a file changed elsewhere is rescanned
+        async with db_lock.read():
+            row_count = await asyncio.to_thread(db_instance.count, table_name)
         
-        # Convert columns to dict
-        columns = [col.to_dict() for col in table.columns.values()]
+        # Serialized columns are cached on the schema until it changes
+        columns = table.column_dicts()
         
         return TableInfo(
             name=table_name,
@@ -157,6 +210,7 @@ async def root():
         "version": "0.1.0",
         "endpoints": {
             "/api/execute": "POST - Execute SQL query",
+            "/api/cache/flush": "POST - Clear cached query results",
             "/tables": "GET - List all tables",
             "/tables/{name}": "GET - Get table info",
             "/health": "GET - Health check",
@@ -1,7 +1,9 @@
 """
 Simple index implementation
 """
-from typing import Dict, List, Any
+import re
+from bisect import bisect_left
+from typing import Dict, FrozenSet, List, Any, Iterable, Optional, Set, Tuple
 
 class Index:
     """Simple hash index for primary keys"""
@@ -9,20 +11,161 @@ class Index:
     def __init__(self, column_name: str):
         self.column_name = column_name
         self.index: Dict[Any, int] = {}  # value -> row_position
+        self._frozen: Optional[FrozenSet[Any]] = None  # key snapshot while read-only
     
     def insert(self, value: Any, position: int):
         """Add entry to index"""
         self.index[value] = position
+        self._frozen = None
     
     def delete(self, value: Any):
         """Remove entry from index"""
         if value in self.index:
             del self.index[value]
+            self._frozen = None
     
     def get(self, value: Any) -> int:
         """Get position by value"""
         return self.index.get(value)
     
+    def freeze(self):
+        """Snapshot the keys for membership tests until the next insert or delete"""
+        self._frozen = frozenset(self.index)
+    
     def contains(self, value: Any) -> bool:
         """Check if value exists in index"""
-        return value in self.index
\ No newline at end of file
+        keys = self._frozen if self._frozen is not None else self.index
+        return value in keys
+    
+    def contains_many(self, values: Iterable[Any]) -> List[bool]:
+        """Membership of each value, in order"""
+        keys = self._frozen if self._frozen is not None else self.index
+        return [value in keys for value in values]
+
+class SortedIndex:
+    """Ordered index for range and prefix lookups, kept as parallel sorted lists"""
+    
+    def __init__(self, column_name: str):
+        self.column_name = column_name
+        self.keys: List[Any] = []       # sorted values
+        self.positions: List[int] = []  # row position of each key
+    
+    @classmethod
+    def build(cls, column_name: str, entries: Iterable[Tuple[Any, int]]) -> 'SortedIndex':
+        """Index (value, position) pairs with one sort instead of repeated inserts"""
+        index = cls(column_name)
+        ordered = sorted(entries)
+        index.keys = [value for value, _ in ordered]
+        index.positions = [position for _, position in ordered]
+        return index
+    
+    def insert(self, value: Any, position: int):
+        """Add entry to index"""
+        i = bisect_left(self.keys, value)
+        while i < len(self.keys) and self.keys[i] == value and self.positions[i] < position:
+            i += 1
+        self.keys.insert(i, value)
+        self.positions.insert(i, position)
+    
+    def delete(self, value: Any, position: int):
+        """Remove one entry from index"""
+        i = bisect_left(self.keys, value)
+        while i < len(self.keys) and self.keys[i] == value:
+            if self.positions[i] == position:
+                del self.keys[i]
+                del self.positions[i]
+                return
+            i += 1
+    
+    def range(self, lo: Any = None, hi: Any = None) -> List[int]:
+        """Positions of entries with lo <= value < hi; None leaves that end open"""
+        start = 0 if lo is None else bisect_left(self.keys, lo)
+        end = len(self.keys) if hi is None else bisect_left(self.keys, hi)
+        return self.positions[start:end]
+    
+    def prefix(self, prefix: str) -> List[int]:
+        """Positions of string entries starting with prefix"""
+        return self.range(prefix, prefix_upper_bound(prefix))
+
+class NGramIndex:
+    """Inverted index from each n-character substring to the positions containing it"""
+    
+    def __init__(self, column_name: str, n: int = 3):
+        self.column_name = column_name
+        self.n = n
+        self.postings: Dict[str, Set[int]] = {}
+    
+    @classmethod
+    def build(cls, column_name: str, entries: Iterable[Tuple[str, int]], n: int = 3) -> 'NGramIndex':
+        """Index (text, position) pairs"""
+        index = cls(column_name, n)
+        for text, position in entries:
+            index.insert(text, position)
+        return index
+    
+    def grams(self, text: str) -> Set[str]:
+        """Distinct n-grams of a string"""
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+    
+    def insert(self, text: str, position: int):
+        """Add entry to index"""
+        postings = self.postings
+        for gram in self.grams(text):
+            postings.setdefault(gram, set()).add(position)
+    
+    def delete(self, text: str, position: int):
+        """Remove entry from index"""
+        for gram in self.grams(text):
+            positions = self.postings.get(gram)
+            if positions is not None:
+                positions.discard(position)
+                if not positions:
+                    del self.postings[gram]
+    
+    def pattern_grams(self, pattern: str) -> Set[str]:
+        """n-grams every match of a LIKE pattern must contain"""
+        grams = set()
+        for literal in re.split('[%_]', pattern):
+            grams |= self.grams(literal)
+        return grams
+    
+    def query(self, pattern: str) -> Optional[Set[int]]:
+        """
+        Candidate positions for a LIKE pattern, or None if it is too short to narrow
+        
+        Candidates contain every n-gram of the pattern's literal parts but
+        must still be checked against the pattern itself.
+        """
+        grams = self.pattern_grams(pattern)
+        if not grams:
+            return None
+        postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for positions in postings[1:]:
+            if not candidates:
+                break
+            candidates &= positions
+        return candidates
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with prefix, e.g. 'ali' -> 'alj'"""
+    while prefix and prefix[-1] == chr(0x10FFFF):
+        prefix = prefix[:-1]
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def like_prefix(pattern: str) -> Optional[str]:
+    """
+    Literal prefix of an anchored LIKE pattern such as 'ali%', else None
+    
+    Only 'literal%' patterns qualify: a leading wildcard or a wildcard inside
+    the literal part cannot be answered by a prefix range.
+    """
+    if not pattern.endswith('%'):
+        return None
+    literal = pattern.rstrip('%')
+    if not literal or '%' in literal or '_' in literal:
+        return None
+    return literal
@@ -1,7 +1,7 @@
 """
 Simple schema manager
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from ..core.datatypes import TYPE_MAP
 
 class Column:
@@ -30,6 +30,7 @@ class Column:
         self.unique = False
         self.not_null = False
         self.encrypted = False
+        self.enforced = True  # False for PRIMARY KEY / UNIQUE ... NOT ENFORCED
     
     def validate(self, value):
         """Validate and convert value to correct type"""
@@ -47,7 +48,8 @@ class Column:
             'primary_key': self.primary_key,
             'unique': self.unique,
             'not_null': self.not_null,
-            'encrypted': self.encrypted
+            'encrypted': self.encrypted,
+            'enforced': self.enforced
         }
 
 class TableSchema:
@@ -57,10 +59,12 @@ class TableSchema:
         self.name = name
         self.columns: Dict[str, Column] = {}
         self.primary_key: str = None
+        self._column_dicts: Optional[List[Dict]] = None
     
     def add_column(self, column: Column):
         """Add a column to the table"""
         self.columns[column.name] = column
+        self._column_dicts = None
         
         # Set primary key
         if column.primary_key:
@@ -68,6 +72,16 @@ class TableSchema:
                 raise ValueError("Only one primary key allowed per table")
             self.primary_key = column.name
     
+    def columns_changed(self):
+        """Drop cached column data after self.columns is modified directly"""
+        self._column_dicts = None
+    
+    def column_dicts(self) -> List[Dict]:
+        """Serialized columns, built once and reused until the columns change"""
+        if self._column_dicts is None:
+            self._column_dicts = [col.to_dict() for col in self.columns.values()]
+        return self._column_dicts
+    
     def get_column_names(self) -> List[str]:
         """Get list of column names in order"""
         return list(self.columns.keys())
@@ -115,6 +129,7 @@ class TableSchema:
             col.unique = col_data['unique']
             col.not_null = col_data['not_null']
             col.encrypted = col_data['encrypted']
+            col.enforced = col_data.get('enforced', True)
             table.add_column(col)
         
         return table
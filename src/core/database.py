@@ -3,33 +3,136 @@ Main database interface with persistent encryption
 """
 
 import os
+import re
 import glob
-from typing import List, Tuple, Any, Optional
-from .exceptions import DatabaseError
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Any, Optional, Sequence
+from .exceptions import DatabaseError, ParseError
 from ..storage.file_manager import FileManager
 from ..catalog.schema import Catalog, TableSchema
-from ..parser.parser import SimpleParser
+from ..parser.parser import SimpleParser, bind_params, placeholder_positions, sql_literal
 from ..executor.crud import CRUDExecutor
 from ..storage.encryption import ColumnEncryptor
 
+# Stand-in for the i-th ? while a template is parsed; as a parsed value on its own,
+# or quoted inside clause text such as a WHERE
+_MARKER_RE = re.compile("\x00param(\\d+)\x00")
+_QUOTED_MARKER_RE = re.compile("'\x00param(\\d+)\x00'")
+
+def _param_marker(index: int) -> str:
+    """Marker string parsed in place of the index-th placeholder"""
+    return f"\x00param{index}\x00"
+
+def _template_markers(node) -> set:
+    """
+    Indexes of the markers in a parsed template, in the forms _substitute replaces
+    
+    A marker left in any other form (unquoted inside text) adds -1, so the
+    template never matches the full set of placeholders.
+    """
+    if isinstance(node, str):
+        whole = _MARKER_RE.fullmatch(node)
+        if whole:
+            return {int(whole.group(1))}
+        found = {int(index) for index in _QUOTED_MARKER_RE.findall(node)}
+        if _MARKER_RE.search(_QUOTED_MARKER_RE.sub('', node)):
+            found.add(-1)
+        return found
+    if isinstance(node, dict):
+        node = list(node.values())
+    if isinstance(node, (list, tuple)):
+        found = set()
+        for item in node:
+            found |= _template_markers(item)
+        return found
+    return set()
+
+def _substitute(node, values: List, literals: List[str]):
+    """Copy of a parsed template with each marker replaced by its parameter"""
+    if isinstance(node, str):
+        whole = _MARKER_RE.fullmatch(node)
+        if whole:
+            return values[int(whole.group(1))]
+        if '\x00' in node:
+            return _QUOTED_MARKER_RE.sub(lambda match: literals[int(match.group(1))], node)
+        return node
+    if isinstance(node, list):
+        return [_substitute(item, values, literals) for item in node]
+    if isinstance(node, tuple):
+        return tuple(_substitute(item, values, literals) for item in node)
+    if isinstance(node, dict):
+        return {key: _substitute(item, values, literals) for key, item in node.items()}
+    return node
+
+class PreparedStatement:
+    """
+    A statement parsed once and executed many times with different parameters
+    
+    The statement is parsed with a marker in place of each ? placeholder.
+    Binding copies that parsed template, putting each parameter where its
+    marker landed: as the value itself in INSERT rows and SET assignments,
+    or as an escaped SQL literal inside clause text such as a WHERE. A
+    statement whose markers cannot all be found is bound with bind_params
+    and parsed again on every call.
+    """
+    
+    def __init__(self, db: "Database", sql: str):
+        self.db = db
+        self.sql = sql
+        self.param_count = len(placeholder_positions(sql))
+        self._template = None
+        
+        markers = [_param_marker(i) for i in range(self.param_count)]
+        try:
+            parsed = db.parser.parse(bind_params(sql, markers))
+        except Exception as e:
+            raise DatabaseError(f"Error: {e}")
+        
+        if _template_markers(parsed) == set(range(self.param_count)):
+            self._template = parsed
+    
+    def bind(self, params: Sequence = ()) -> Dict:
+        """Parsed statement with params bound to its placeholders in order"""
+        params = list(params)
+        if len(params) != self.param_count:
+            raise ParseError(f"Statement has {self.param_count} placeholder(s) but {len(params)} parameter(s) were given")
+        
+        if self._template is None:
+            return self.db.parser.parse(bind_params(self.sql, params))
+        # sql_literal also rejects types the parser could not read back
+        literals = [sql_literal(value) for value in params]
+        return _substitute(self._template, params, literals)
+    
+    def execute(self, params: Sequence = ()) -> List[Tuple]:
+        """Run the statement with params bound to its placeholders in order"""
+        try:
+            return self.db.executor.execute(self.bind(params))
+        except Exception as e:
+            raise DatabaseError(f"Error: {e}")
+
 class Database:
     """Main database class"""
     
-    def __init__(self, db_file: str = "default.maldb"):
+    def __init__(self, db_file: str = "default.maldb", master_key: Optional[bytes] = None):
         """
         Initialize or connect to a database
         
         Args:
             db_file: Path to database file (.maldb extension)
+            master_key: Raw 32-byte master key. If None, read from env or key file.
         """
         self.db_file = db_file
         self.file_manager = FileManager(db_file)
         self.catalog = Catalog()
         self.parser = SimpleParser()
+        # Parsed SELECTs are read-only, so repeated queries can share them
+        self._parse_select = lru_cache(maxsize=128)(self.parser.parse)
+        # Parameterized statements are parsed once per SQL template, before binding
+        self._prepare_cached = lru_cache(maxsize=128)(self.prepare)
         
         # Create encryptor with key file in same directory as database
         key_file = os.path.join(os.path.dirname(db_file), "maldb_key.json")
-        self.encryptor = ColumnEncryptor(key_file=key_file)
+        self.encryptor = ColumnEncryptor(master_key=master_key, key_file=key_file)
         
         self.executor = CRUDExecutor(self.file_manager, self.catalog, self.encryptor)
         
@@ -53,19 +156,25 @@ class Database:
             except Exception as e:
                 print(f"Warning: Could not load table {table_name}: {e}")
     
-    def execute(self, sql: str) -> List[Tuple]:
+    def execute(self, sql: str, params: Optional[Sequence] = None) -> List[Tuple]:
         """
         Execute a SQL statement
         
         Args:
-            sql: SQL statement string
+            sql: SQL statement string, with ? placeholders if params is given
+            params: Values bound to the placeholders in order
             
         Returns:
             List of tuples representing rows
         """
         try:
             # Parse SQL
-            parsed = self.parser.parse(sql)
+            if params is not None:
+                parsed = self._prepare_cached(sql).bind(params)
+            elif sql.lstrip()[:6].upper() == 'SELECT':
+                parsed = self._parse_select(sql)
+            else:
+                parsed = self.parser.parse(sql)
             
             # Execute command
             result = self.executor.execute(parsed)
@@ -75,6 +184,86 @@ class Database:
         except Exception as e:
             raise DatabaseError(f"Error: {e}")
     
+    def iter_execute(self, sql: str, params: Optional[Sequence] = None) -> Iterator[Tuple]:
+        """
+        Execute a SQL statement, yielding result rows lazily
+        
+        Plain SELECTs are read from storage a row at a time; any other
+        statement runs through execute() and its result is yielded.
+        """
+        if params is None and sql.lstrip()[:6].upper() != 'SELECT':
+            yield from self.execute(sql)
+            return
+        
+        try:
+            if params is not None:
+                parsed = self._prepare_cached(sql).bind(params)
+            else:
+                parsed = self._parse_select(sql)
+        except Exception as e:
+            raise DatabaseError(f"Error: {e}")
+        
+        if parsed['command'] != 'SELECT':
+            try:
+                yield from self.executor.execute(parsed)
+            except Exception as e:
+                raise DatabaseError(f"Error: {e}")
+            return
+        
+        try:
+            yield from self.executor.iter_select(parsed)
+        except Exception as e:
+            raise DatabaseError(f"Error: {e}")
+    
+    def prepare(self, sql: str) -> PreparedStatement:
+        """
+        Parse a statement once for repeated execution
+        
+        Args:
+            sql: SQL statement string with ? placeholders
+            
+        Returns:
+            PreparedStatement whose execute(params) binds and runs it
+        """
+        return PreparedStatement(self, sql)
+    
+    def insert_many(self, table_name: str, rows: Sequence[Sequence[Any]],
+                    columns: Optional[Sequence[str]] = None) -> int:
+        """
+        Insert several rows with one validation pass and a single file append
+        
+        Args:
+            table_name: Table to insert into
+            rows: Row values, each in the order of columns
+            columns: Column names the values map to; all columns if None
+            
+        Returns:
+            Number of rows inserted
+        """
+        rows = [list(row) for row in rows]
+        if not rows:
+            return 0
+        
+        parsed = {'command': 'INSERT', 'table': table_name, 'values': rows[0], 'rows': rows}
+        if columns is not None:
+            parsed['columns'] = list(columns)
+        
+        try:
+            self.executor.insert(parsed)
+        except Exception as e:
+            raise DatabaseError(f"Error: {e}")
+        return len(rows)
+    
+    def count(self, table_name: str) -> int:
+        """Number of rows in a table, counted from storage without decoding them"""
+        if not self.catalog.table_exists(table_name):
+            raise DatabaseError(f"Error: Table '{table_name}' does not exist")
+        return self.file_manager.count_rows(table_name)
+    
+    def list_tables(self) -> List[str]:
+        """Names of all tables in the catalog"""
+        return sorted(self.catalog.tables)
+    
     def close(self):
         """Close database connection"""
         pass
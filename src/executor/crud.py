@@ -1,11 +1,25 @@
 """
 Enhanced CRUD executor with WHERE clause support
 """
-from typing import List, Tuple, Any, Dict
+from typing import List, Tuple, Any, Dict, Iterator, Optional
 import os
+import re
+from functools import lru_cache
 from ..core.exceptions import ExecutionError
+from ..catalog.index import Index, NGramIndex, SortedIndex, like_prefix
+from ..parser.parser import unescape_literal, unquote_literal
 from ..storage.encryption import ColumnEncryptor
 from .join import JoinExecutor
+from .values import decode_value
+
+# column LIKE 'pattern', with backslash escapes inside the quotes
+_LIKE_RE = re.compile(r"^\s*(\w+)\s+LIKE\s+'((?:[^'\\]|\\.)*)'\s*$", re.IGNORECASE | re.DOTALL)
+
+@lru_cache(maxsize=256)
+def _like_regex(pattern: str):
+    """Compiled regex for a LIKE pattern: % is any run of characters, _ any one"""
+    parts = ('.*' if ch == '%' else '.' if ch == '_' else re.escape(ch) for ch in pattern)
+    return re.compile(''.join(parts), re.DOTALL)
 
 class CRUDExecutor:
     """Executes basic CRUD operations with WHERE clause support"""
@@ -21,6 +35,8 @@ class CRUDExecutor:
             self.encryptor = encryptor
         
         self.join_executor = JoinExecutor(file_manager, catalog, self.encryptor)
+        # (table, column, index class) -> (table stamp, index) for columns searched with LIKE
+        self._indexes: Dict[Tuple[str, str, type], Tuple[Tuple, Any]] = {}
     
     def execute(self, parsed: Dict) -> List[Tuple]:
         """Execute a parsed SQL command"""
@@ -82,9 +98,9 @@ class CRUDExecutor:
         return []
     
     def insert(self, parsed: Dict) -> List[Tuple]:
-        """Execute INSERT with constraint enforcement"""
+        """Execute INSERT (single or multi-row) with constraint enforcement"""
         table_name = parsed['table']
-        values = parsed.get('values', [])
+        rows = parsed.get('rows') or [parsed.get('values', [])]
         columns = parsed.get('columns', None)
         
         # Get table schema
@@ -99,71 +115,87 @@ class CRUDExecutor:
         else:
             col_names = table.get_column_names()
         
-        # Validate values against schema
-        try:
-            validated_values = table.validate_row(values, col_names)
-        except Exception as e:
-            raise ExecutionError(f"Validation error: {e}")
-        
-        # Check constraints BEFORE inserting
-        self._check_constraints_before_insert(table_name, table, col_names, validated_values)
-        
-        # Encrypt values if needed
-        encrypted_values = []
-        for col_name, value in zip(col_names, validated_values):
-            col = table.columns[col_name]
-            if col.encrypted and value is not None:
-                column_id = f"{table_name}.{col_name}"
-                encrypted_value = self.encryptor.encrypt_value(column_id, str(value))
-                encrypted_values.append(encrypted_value)
-            else:
-                encrypted_values.append(value)
+        # Validate every row up front; rows before a failing one are still
+        # checked for constraint violations first, matching row-by-row order
+        validated_rows = []
+        validation_error = None
+        for values in rows:
+            try:
+                validated_rows.append(table.validate_row(values, col_names))
+            except Exception as e:
+                validation_error = ExecutionError(f"Validation error: {e}")
+                break
+        
+        # Check constraints BEFORE inserting (including earlier rows of this batch)
+        self._check_constraints_before_insert(table_name, table, col_names, validated_rows)
+        if validation_error is not None:
+            raise validation_error
+        
+        new_rows = []
+        for validated_values in validated_rows:
+            # Encrypt values if needed
+            encrypted_values = []
+            for col_name, value in zip(col_names, validated_values):
+                col = table.columns[col_name]
+                if col.encrypted and value is not None:
+                    column_id = f"{table_name}.{col_name}"
+                    encrypted_value = self.encryptor.encrypt_value(column_id, str(value))
+                    encrypted_values.append(encrypted_value)
+                else:
+                    encrypted_values.append(value)
+            
+            new_rows.append(encrypted_values)
         
-        # Save to disk
-        self.file_manager.insert_row(table_name, encrypted_values)
+        # Save to disk in a single append
+        self._drop_indexes(table_name)
+        self.file_manager.insert_rows(table_name, new_rows)
         
-        print(f"✅ 1 row inserted into '{table_name}'")
+        if len(new_rows) == 1:
+            print(f"✅ 1 row inserted into '{table_name}'")
+        else:
+            print(f"✅ {len(new_rows)} row(s) inserted into '{table_name}'")
         return []
     
-    def _check_constraints_before_insert(self, table_name: str, table, col_names: List[str], values: List):
-        """Check constraints before inserting a row"""
-        # Get all existing rows
-        rows = self.file_manager.get_all_rows(table_name)
+    def _check_constraints_before_insert(self, table_name: str, table, col_names: List[str], rows_values: List[List]):
+        """Check PRIMARY KEY and UNIQUE constraints for a batch of validated rows"""
+        all_columns = list(table.columns.keys())
+        
+        # PRIMARY KEY columns are reported before UNIQUE ones, as a row is checked
+        checks = []
+        for kind, wanted in (("PRIMARY KEY", lambda c: c.primary_key), ("UNIQUE", lambda c: c.unique)):
+            for position, col_name in enumerate(col_names):
+                col = table.columns[col_name]
+                # Encrypted values are stored with a random nonce, so they never compare equal
+                if wanted(col) and col.enforced and not col.encrypted:
+                    checks.append((kind, col_name, position))
+        if not checks or not rows_values:
+            return
+        
+        # One frozen index per constrained column, probed for the whole batch at once
+        existing_rows = self.file_manager.get_all_rows(table_name)
+        probes = []
+        for kind, col_name, position in checks:
+            col_index = all_columns.index(col_name)
+            index = Index(col_name)
+            for row_position, row in enumerate(existing_rows):
+                if len(row) > col_index:
+                    index.insert(row[col_index], row_position)
+            index.freeze()
+            
+            batch = [None if values[position] is None else str(values[position]) for values in rows_values]
+            probes.append((kind, col_name, position, batch, index.contains_many(batch), set()))
         
-        # Convert values to string for comparison (but handle encryption)
-        values_to_check = []
-        for col_name, value in zip(col_names, values):
-            col = table.columns[col_name]
-            if col.encrypted and value is not None:
-                column_id = f"{table_name}.{col_name}"
-                encrypted_value = self.encryptor.encrypt_value(column_id, str(value))
-                values_to_check.append(encrypted_value)
-            else:
-                values_to_check.append(str(value) if value is not None else None)
-        
-        # Check PRIMARY KEY constraint
-        for col_name, value_to_check in zip(col_names, values_to_check):
-            col = table.columns[col_name]
-            if col.primary_key:
-                # Check if value already exists
-                col_index = list(table.columns.keys()).index(col_name)
-                for row in rows:
-                    if len(row) > col_index and row[col_index] == value_to_check:
-                        # Get the actual value for error message
-                        actual_value = values[col_names.index(col_name)]
-                        raise ExecutionError(f"PRIMARY KEY constraint violation: value '{actual_value}' already exists in column '{col_name}'")
-        
-        # Check UNIQUE constraint
-        for col_name, value_to_check in zip(col_names, values_to_check):
-            col = table.columns[col_name]
-            if col.unique:
-                # Check if value already exists
-                col_index = list(table.columns.keys()).index(col_name)
-                for row in rows:
-                    if len(row) > col_index and row[col_index] == value_to_check:
-                        # Get the actual value for error message
-                        actual_value = values[col_names.index(col_name)]
-                        raise ExecutionError(f"UNIQUE constraint violation: value '{actual_value}' already exists in column '{col_name}'")
+        for row_number, values in enumerate(rows_values):
+            for kind, col_name, position, batch, existing, seen in probes:
+                value = batch[row_number]
+                if value is None:
+                    continue
+                if existing[row_number] or value in seen:
+                    raise ExecutionError(f"{kind} constraint violation: value '{values[position]}' already exists in column '{col_name}'")
+            # Later rows of the batch must not repeat this one
+            for kind, col_name, position, batch, existing, seen in probes:
+                if batch[row_number] is not None:
+                    seen.add(batch[row_number])
     
     def select(self, parsed: Dict) -> List[Tuple]:
         """Execute SELECT with WHERE clause support"""
@@ -176,36 +208,162 @@ class CRUDExecutor:
             raise ExecutionError(f"Table '{table_name}' does not exist")
         
         table = self.catalog.get_table(table_name)
+        count_only = len(columns) == 1 and columns[0].replace(' ', '').upper() == 'COUNT(*)'
+        
+        # COUNT(*) without WHERE needs no decryption, type conversion or row list
+        if count_only and not where_clause:
+            count = self.file_manager.count_rows(table_name)
+            print(f"\n📊 {count} row(s) counted")
+            return [(count,)]
+        
+        # Rows from disk, narrowed through an index when the WHERE allows it
+        rows = self._indexed_rows(table_name, table, where_clause)
+        if rows is None:
+            rows = self.file_manager.get_all_rows(table_name)
+        
+        # Resolve projected columns before touching any rows
+        col_indices = self._projection(table_name, table, columns) if not count_only else None
+        processed_rows = self._iter_matching_rows(table_name, table, rows, where_clause)
+        
+        if count_only:
+            count = sum(1 for _ in processed_rows)
+            print(f"\n📊 {count} row(s) counted")
+            return [(count,)]
+        
+        if col_indices is not None:
+            result = [tuple(row[i] for i in col_indices) for row in processed_rows]
+        else:
+            result = list(processed_rows)
         
-        # Get all rows from disk
-        rows = self.file_manager.get_all_rows(table_name)
+        # Print result nicely
+        if result:
+            print(f"\n📊 {len(result)} row(s) returned:")
+            for row in result:
+                print(f"  {row}")
+        else:
+            print("\n📭 No rows found")
         
-        # Process rows (decrypt, type conversion, filtering)
-        processed_rows = []
-        for row_idx, row in enumerate(rows):
+        return result
+    
+    def iter_select(self, parsed: Dict) -> Iterator[Tuple]:
+        """Yield SELECT result rows as they are read from disk, without printing"""
+        table_name = parsed['table']
+        columns = parsed['columns']
+        
+        if not self.catalog.table_exists(table_name):
+            raise ExecutionError(f"Table '{table_name}' does not exist")
+        
+        table = self.catalog.get_table(table_name)
+        if len(columns) == 1 and columns[0].replace(' ', '').upper() == 'COUNT(*)':
+            yield from self.select(parsed)
+            return
+        
+        col_indices = self._projection(table_name, table, columns)
+        where_clause = parsed.get('where')
+        stored = self._indexed_rows(table_name, table, where_clause)
+        if stored is None:
+            stored = self.file_manager.iter_rows(table_name)
+        rows = self._iter_matching_rows(table_name, table, stored, where_clause)
+        if col_indices is None:
+            yield from rows
+        else:
+            for row in rows:
+                yield tuple(row[i] for i in col_indices)
+    
+    def _projection(self, table_name: str, table, columns: List[str]):
+        """Indices of the selected columns, or None for SELECT *"""
+        if columns == ['*']:
+            return None
+        col_positions = {name: i for i, name in enumerate(table.columns)}
+        col_indices = []
+        for col in columns:
+            if col in col_positions:
+                col_indices.append(col_positions[col])
+            else:
+                raise ExecutionError(f"Column '{col}' does not exist in table '{table_name}'")
+        return col_indices
+    
+    def _indexed_rows(self, table_name: str, table, where_clause: Optional[str]) -> Optional[List[List]]:
+        """
+        Stored rows that can satisfy WHERE col LIKE 'pattern', found by index
+        
+        'prefix%' patterns use a SortedIndex range and other patterns with a
+        literal run of at least three characters use an NGramIndex. Returns
+        None when no index applies, so the caller scans. Indexes are built on
+        first use and reused until the table changes; with a cached index only
+        the candidate rows are read, each by seeking to its byte offset.
+        Candidates still go through the WHERE check.
+        """
+        like = _LIKE_RE.match(where_clause) if where_clause else None
+        if like is None:
+            return None
+        col_name = like.group(1)
+        pattern = unescape_literal(like.group(2))
+        if col_name not in table.columns:
+            return None
+        prefix = like_prefix(pattern)
+        if prefix is None and not NGramIndex(col_name).pattern_grams(pattern):
+            return None
+        
+        stamp = self.file_manager.table_stamp(table_name)
+        if stamp is None:
+            return None
+        
+        if prefix is not None:
+            index, rows = self._column_index(SortedIndex, table_name, table, col_name, stamp)
+            positions = sorted(index.prefix(prefix))
+        else:
+            index, rows = self._column_index(NGramIndex, table_name, table, col_name, stamp)
+            positions = sorted(index.query(pattern))
+        if rows is None:
+            return self.file_manager.get_rows_at(table_name, positions)
+        return [rows[position] for position in positions]
+    
+    def _column_index(self, kind: type, table_name: str, table, col_name: str, stamp: Tuple):
+        """
+        Cached index of a column's text values, rebuilt when the table stamp changes
+        
+        Returns (index, rows): rows is the full table if it had to be read to
+        build the index, otherwise None.
+        """
+        key = (table_name, col_name, kind)
+        cached = self._indexes.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], None
+        
+        rows = self.file_manager.get_all_rows(table_name)
+        col = table.columns[col_name]
+        col_pos = table.get_column_names().index(col_name)
+        entries = []
+        for position, row in enumerate(rows):
+            if col_pos < len(row):
+                value = decode_value(self.encryptor, table_name, col_name, col, row[col_pos])
+                if value is not None:
+                    entries.append((str(value), position))
+        index = kind.build(col_name, entries)
+        self._indexes[key] = (stamp, index)
+        return index, rows
+    
+    def _drop_indexes(self, table_name: str):
+        """
+        Forget a table's cached LIKE indexes before this executor writes to it
+        
+        The table stamp alone can miss a same-size in-place write when the
+        filesystem's mtime is coarser than the time between two writes.
+        """
+        for key in [key for key in self._indexes if key[0] == table_name]:
+            del self._indexes[key]
+    
+    def _iter_matching_rows(self, table_name: str, table, rows, where_clause) -> Iterator[Tuple]:
+        """Decrypt and convert stored rows, yielding those that pass the WHERE clause"""
+        col_names = table.get_column_names()
+        for row in rows:
             processed_row = []
             row_data = {}  # For WHERE clause evaluation
             
-            for col_name, value in zip(table.get_column_names(), row):
-                col = table.columns[col_name]
-                
-                # Handle NULL/empty
-                if value == '' or value is None:
-                    processed_value = None
-                else:
-                    # Convert based on column type
-                    if col.encrypted and value is not None:
-                        column_id = f"{table_name}.{col_name}"
-                        try:
-                            processed_value = self.encryptor.decrypt_value(column_id, value)
-                        except Exception as e:
-                            processed_value = f"[ENCRYPTED: {str(e)}]"
-                    else:
-                        try:
-                            processed_value = col.validate(value)
-                        except:
-                            processed_value = value
-                
+            for col_name, value in zip(col_names, row):
+                # Decrypt or convert based on column type; NULL/empty becomes None
+                processed_value = decode_value(self.encryptor, table_name, col_name, table.columns[col_name], value)
                 processed_row.append(processed_value)
                 row_data[col_name] = processed_value
             
@@ -213,42 +371,24 @@ class CRUDExecutor:
             if where_clause:
                 try:
                     if self._evaluate_where(row_data, where_clause):
-                        processed_rows.append(tuple(processed_row))
+                        yield tuple(processed_row)
                 except Exception as e:
                     # If WHERE evaluation fails, skip the row
                     continue
             else:
-                processed_rows.append(tuple(processed_row))
-        
-        # Filter columns if needed
-        if columns != ['*']:
-            col_indices = []
-            for col in columns:
-                if col in table.columns:
-                    col_indices.append(list(table.columns.keys()).index(col))
-                else:
-                    raise ExecutionError(f"Column '{col}' does not exist in table '{table_name}'")
-            
-            result = []
-            for row in processed_rows:
-                result.append(tuple(row[i] for i in col_indices))
-        else:
-            result = processed_rows
-        
-        # Print result nicely
-        if result:
-            print(f"\n📊 {len(result)} row(s) returned:")
-            for row in result:
-                print(f"  {row}")
-        else:
-            print("\n📭 No rows found")
-        
-        return result
+                yield tuple(processed_row)
     
     def _evaluate_where(self, row_data: Dict, where_clause: str) -> bool:
         """Simple WHERE clause evaluation"""
         where_clause = where_clause.strip()
         
+        # Check for LIKE: column LIKE 'pattern', % matching any run of characters and _ one
+        like = _LIKE_RE.match(where_clause)
+        if like:
+            value = row_data.get(like.group(1))
+            pattern = unescape_literal(like.group(2))
+            return value is not None and _like_regex(pattern).fullmatch(str(value)) is not None
+        
         # Check for IS NULL
         if 'IS NULL' in where_clause.upper():
             col_name = where_clause.split('IS')[0].strip()
@@ -266,7 +406,8 @@ class CRUDExecutor:
             parts = where_clause.split('=', 1)
             if len(parts) == 2:
                 col_name = parts[0].strip()
-                value_str = parts[1].strip().strip("'\"")
+                # Unquote the same way INSERT values are parsed
+                value_str = unquote_literal(parts[1].strip())
                 
                 if col_name in row_data:
                     # Handle NULL comparison
@@ -280,7 +421,8 @@ class CRUDExecutor:
             parts = where_clause.split('!=', 1)
             if len(parts) == 2:
                 col_name = parts[0].strip()
-                value_str = parts[1].strip().strip("'\"")
+                # Unquote the same way INSERT values are parsed
+                value_str = unquote_literal(parts[1].strip())
                 
                 if col_name in row_data:
                     # Handle NULL comparison
@@ -345,22 +487,7 @@ class CRUDExecutor:
             row_data = {}
             
             for col_name, value in zip(table.get_column_names(), row):
-                col = table.columns[col_name]
-                
-                if value == '' or value is None:
-                    row_data[col_name] = None
-                else:
-                    if col.encrypted and value is not None:
-                        column_id = f"{table_name}.{col_name}"
-                        try:
-                            row_data[col_name] = self.encryptor.decrypt_value(column_id, value)
-                        except:
-                            row_data[col_name] = "[ENCRYPTED]"
-                    else:
-                        try:
-                            row_data[col_name] = col.validate(value)
-                        except:
-                            row_data[col_name] = value
+                row_data[col_name] = decode_value(self.encryptor, table_name, col_name, table.columns[col_name], value)
             
             # Check WHERE condition
             if where_clause:
@@ -370,6 +497,8 @@ class CRUDExecutor:
             rows_to_delete.append(row_idx)
         
         # Delete rows
+        if rows_to_delete:
+            self._drop_indexes(table_name)
         deleted_count = 0
         for row_idx in rows_to_delete:
             self.file_manager.delete_row_by_index(table_name, row_idx)
@@ -397,22 +526,7 @@ class CRUDExecutor:
         for row_idx, row in enumerate(rows):
             row_data = {}
             for col_name, value in zip(table.get_column_names(), row):
-                col = table.columns[col_name]
-                
-                if value == '' or value is None:
-                    row_data[col_name] = None
-                else:
-                    if col.encrypted and value is not None:
-                        column_id = f"{table_name}.{col_name}"
-                        try:
-                            row_data[col_name] = self.encryptor.decrypt_value(column_id, value)
-                        except:
-                            row_data[col_name] = "[ENCRYPTED]"
-                    else:
-                        try:
-                            row_data[col_name] = col.validate(value)
-                        except:
-                            row_data[col_name] = value
+                row_data[col_name] = decode_value(self.encryptor, table_name, col_name, table.columns[col_name], value)
             
             # Check WHERE condition
             if where_clause:
@@ -434,7 +548,7 @@ class CRUDExecutor:
                     raise ExecutionError(f"Invalid value for column '{col_name}': {e}")
                 
                 # Check constraints for updated value
-                if col.primary_key or col.unique:
+                if (col.primary_key or col.unique) and col.enforced:
                     # Check if new value already exists in other rows
                     col_index = list(table.columns.keys()).index(col_name)
                     for other_row_idx, other_row in enumerate(rows):
@@ -460,6 +574,7 @@ class CRUDExecutor:
                     new_row[list(table.columns.keys()).index(col_name)] = validated_value
             
             # Save updated row - FIXED: removed the extra has_header parameter
+            self._drop_indexes(table_name)
             self.file_manager.update_row(table_name, row_idx, new_row)
             updated_rows += 1
         
@@ -513,8 +628,10 @@ class CRUDExecutor:
         
         # Add column to schema
         table.columns[column.name] = column
+        table.columns_changed()
         
         # Update all existing rows with NULL for the new column
+        self._drop_indexes(table_name)
         rows = self.file_manager.get_all_rows(table_name)
         if rows:
             updated_rows = []
@@ -540,6 +657,7 @@ class CRUDExecutor:
         
         # Remove from catalog
         del self.catalog.tables[table_name]
+        self._drop_indexes(table_name)
         
         # Remove files
         import os
@@ -568,6 +686,7 @@ class CRUDExecutor:
                 constraints = []
                 if col.primary_key: constraints.append("PRIMARY KEY")
                 if col.unique: constraints.append("UNIQUE")
+                if (col.primary_key or col.unique) and not col.enforced: constraints.append("NOT ENFORCED")
                 if col.not_null: constraints.append("NOT NULL")
                 if col.encrypted: constraints.append("ENCRYPTED")
                 
@@ -588,7 +707,7 @@ class CRUDExecutor:
         """Show help"""
         print("\n📖 MALDB SQL Commands:")
         print("   CREATE TABLE name (col1 TYPE [CONSTRAINTS], col2 TYPE, ...)")
-        print("   INSERT INTO table VALUES (val1, val2, ...)")
+        print("   INSERT INTO table VALUES (val1, val2, ...)[, (val1, val2, ...)]")
         print("   INSERT INTO table (col1, col2) VALUES (val1, val2)")
         print("   SELECT * FROM table [WHERE condition]")
         print("   UPDATE table SET column = value [WHERE condition]")
@@ -598,6 +717,6 @@ class CRUDExecutor:
         print("   EXPLAIN query")
         print("   help;")
         print("   exit;")
-        print("\n📋 Constraints: PRIMARY KEY, UNIQUE, NOT NULL, ENCRYPTED")
+        print("\n📋 Constraints: PRIMARY KEY, UNIQUE, NOT NULL, ENCRYPTED, NOT ENFORCED")
         print("📋 Data Types: INT, VARCHAR(N), TEXT, DECIMAL, BOOLEAN")
         return []
\ No newline at end of file
@@ -35,6 +35,8 @@ def explain_plan(plan: dict) -> str:
                 constraints.append("PRIMARY KEY")
             if col.unique:
                 constraints.append("UNIQUE")
+            if (col.primary_key or col.unique) and not col.enforced:
+                constraints.append("NOT ENFORCED")
             if col.not_null:
                 constraints.append("NOT NULL")
             if col.encrypted:
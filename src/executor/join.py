@@ -1,8 +1,10 @@
 """
 Basic JOIN implementation
 """
-from typing import List, Tuple
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 from ..core.exceptions import ExecutionError
+from .values import ENCRYPTED_PLACEHOLDER, decode_value
 
 class JoinExecutor:
     """Handles basic JOIN operations"""
@@ -51,30 +53,75 @@ class JoinExecutor:
         t1_schema = self.catalog.get_table(table1)
         t2_schema = self.catalog.get_table(table2)
         
-        # Get all rows
-        t1_rows = self._get_decrypted_rows(table1, t1_schema)
-        t2_rows = self._get_decrypted_rows(table2, t2_schema)
-        
-        # Perform join
-        result = []
-        
-        for row1 in t1_rows:
-            row1_dict = dict(zip(t1_schema.get_column_names(), row1))
-            
-            for row2 in t2_rows:
-                row2_dict = dict(zip(t2_schema.get_column_names(), row2))
-                
-                # Check join condition
-                left_value = row1_dict.get(left_col) if left_table == table1 else row2_dict.get(left_col)
-                right_value = row1_dict.get(right_col) if right_table == table1 else row2_dict.get(right_col)
-                
+        # Resolve each side of the condition to (row of table1 or table2, column position)
+        t1_names = t1_schema.get_column_names()
+        t2_names = t2_schema.get_column_names()
+        left_in_t1 = left_table == table1
+        right_in_t1 = right_table == table1
+        left_names = t1_names if left_in_t1 else t2_names
+        right_names = t1_names if right_in_t1 else t2_names
+        if left_col not in left_names or right_col not in right_names:
+            return []
+        left_idx = left_names.index(left_col)
+        right_idx = right_names.index(right_col)
+        
+        # Get all rows as stored; decoding happens once we know which rows can match
+        t1_raw = self.file_manager.get_all_rows(table1)
+        t2_raw = self.file_manager.get_all_rows(table2)
+        
+        # Both sides on one table: the condition filters that table's rows
+        if left_in_t1 == right_in_t1:
+            t1_rows = self._get_decrypted_rows(table1, t1_schema, t1_raw)
+            t2_rows = self._get_decrypted_rows(table2, t2_schema, t2_raw)
+            same_rows = t1_rows if left_in_t1 else t2_rows
+            matching = []
+            for row in same_rows:
+                left_value = self._value_at(row, left_idx)
+                right_value = self._value_at(row, right_idx)
                 if left_value is not None and right_value is not None and str(left_value) == str(right_value):
-                    # Combine rows
-                    combined_row = list(row1) + list(row2)
-                    result.append(tuple(combined_row))
+                    matching.append(row)
+            if left_in_t1:
+                return [tuple(row1) + tuple(row2) for row1 in matching for row2 in t2_rows]
+            return [tuple(row1) + tuple(row2) for row1 in t1_rows for row2 in matching]
+        
+        t1_idx, t2_idx = (left_idx, right_idx) if left_in_t1 else (right_idx, left_idx)
+        
+        # Decode only table1's keys first, so table2 rows with no partner are
+        # never decrypted; table1 is then decoded only where table2 has its key
+        t1_keys = self._key_values(table1, t1_schema, t1_raw, t1_idx)
+        t2_keys = self._key_values(table2, t2_schema, t2_raw, t2_idx)
+        
+        # Keys are compared as strings (so 1 matches '1'); normalize each once here
+        t1_join_keys = [None if key is None else str(key) for key in t1_keys]
+        t2_join_keys = [None if key is None else str(key) for key in t2_keys]
+        t1_key_set = set(t1_join_keys)
+        t1_key_set.discard(None)
+        
+        t2_keep = [key in t1_key_set for key in t2_join_keys]
+        t2_rows = self._get_decrypted_rows(table2, t2_schema, t2_raw, t2_idx, t2_keys, t2_keep)
+        
+        # Hash join: bucket table2 by key, then probe once per table1 row.
+        # Probing in table1 order keeps the nested-loop output order.
+        buckets: Dict[str, List[Tuple]] = defaultdict(list)
+        kept_t2_keys = (key for key, keep in zip(t2_join_keys, t2_keep) if keep)
+        for row2, key in zip(t2_rows, kept_t2_keys):
+            buckets[key].append(row2)
+        
+        t1_keep = [key in buckets for key in t1_join_keys]
+        t1_rows = self._get_decrypted_rows(table1, t1_schema, t1_raw, t1_idx, t1_keys, t1_keep)
+        kept_t1_keys = (key for key, keep in zip(t1_join_keys, t1_keep) if keep)
+        result = []
+        for row1, key in zip(t1_rows, kept_t1_keys):
+            for row2 in buckets[key]:
+                result.append(row1 + row2)
         
         return result
     
+    @staticmethod
+    def _value_at(row: Tuple, index: int):
+        """Value at a column position, or None for a row stored with fewer columns"""
+        return row[index] if index < len(row) else None
+    
     def _parse_column_ref(self, column_ref: str):
         """Parse table.column reference"""
         column_ref = column_ref.strip()
@@ -93,31 +140,49 @@ class JoinExecutor:
         
         return table_name, column_name
     
-    def _get_decrypted_rows(self, table_name: str, schema):
-        """Get all rows with decrypted values"""
-        rows = self.file_manager.get_all_rows(table_name)
-        decrypted_rows = []
-        
-        for row in rows:
-            decrypted_row = []
-            for col_name, value in zip(schema.get_column_names(), row):
-                col = schema.columns[col_name]
-                
-                if value == '' or value is None:
-                    decrypted_row.append(None)
-                else:
-                    if col.encrypted and value is not None:
-                        column_id = f"{table_name}.{col_name}"
-                        try:
-                            decrypted_row.append(self.encryptor.decrypt_value(column_id, value))
-                        except:
-                            decrypted_row.append("[ENCRYPTED]")
-                    else:
-                        try:
-                            decrypted_row.append(col.validate(value))
-                        except:
-                            decrypted_row.append(value)
-            
-            decrypted_rows.append(tuple(decrypted_row))
-        
-        return decrypted_rows
\ No newline at end of file
+    def _decode_column(self, table_name: str, col_name: str, col, values: List) -> List[Any]:
+        """Decode one column's stored values, decrypting them in a single batch"""
+        if not col.encrypted:
+            return [decode_value(self.encryptor, table_name, col_name, col, value) for value in values]
+        try:
+            plaintexts = self.encryptor.decrypt_many(f"{table_name}.{col_name}", values)
+        except:
+            plaintexts = [ENCRYPTED_PLACEHOLDER] * len(values)
+        return [None if value == '' or value is None else plaintext
+                for value, plaintext in zip(values, plaintexts)]
+    
+    def _key_values(self, table_name: str, schema, rows: List[List], key_idx: int) -> List[Any]:
+        """Decoded join key of each row (None if missing), decoding only the key column"""
+        col_name = schema.get_column_names()[key_idx]
+        col = schema.columns[col_name]
+        values = [row[key_idx] if key_idx < len(row) else None for row in rows]
+        return self._decode_column(table_name, col_name, col, values)
+    
+    def _get_decrypted_rows(self, table_name: str, schema, rows: Optional[List[List]] = None,
+                            key_idx: Optional[int] = None, keys: Optional[List[Any]] = None,
+                            keep: Optional[List[bool]] = None):
+        """
+        Get rows with decrypted values
+        
+        Given the rows' decoded keys (see _key_values), the key column is reused
+        rather than decoded again, and rows whose keep flag is False are skipped
+        without decoding any other column.
+        """
+        if rows is None:
+            rows = self.file_manager.get_all_rows(table_name)
+        columns = [(col_name, schema.columns[col_name]) for col_name in schema.get_column_names()]
+        kept = [row_index for row_index in range(len(rows)) if keep is None or keep[row_index]]
+        widths = [min(len(columns), len(rows[row_index])) for row_index in kept]
+        
+        # Decode column by column so each encrypted column is decrypted in one batch
+        decoded_columns = []
+        for col_index, (col_name, col) in enumerate(columns):
+            if keys is not None and col_index == key_idx:
+                decoded_columns.append([keys[row_index] for row_index in kept])
+                continue
+            values = [rows[row_index][col_index] if col_index < width else None
+                      for row_index, width in zip(kept, widths)]
+            decoded_columns.append(self._decode_column(table_name, col_name, col, values))
+        
+        return [tuple(decoded_columns[col_index][position] for col_index in range(width))
+                for position, width in enumerate(widths)]
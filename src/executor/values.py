@@ -0,0 +1,20 @@
+"""
+Stored value decoding shared by the executors
+"""
+
+# Shown in place of an encrypted value that cannot be decrypted
+ENCRYPTED_PLACEHOLDER = "[ENCRYPTED]"
+
+def decode_value(encryptor, table_name: str, col_name: str, col, value):
+    """Stored CSV value to its Python value, decrypting if the column is encrypted"""
+    if value == '' or value is None:
+        return None
+    if col.encrypted:
+        try:
+            return encryptor.decrypt_value(f"{table_name}.{col_name}", value)
+        except Exception:
+            return ENCRYPTED_PLACEHOLDER
+    try:
+        return col.validate(value)
+    except Exception:
+        return value
@@ -6,6 +6,71 @@ from typing import List, Tuple, Dict, Any
 from ..catalog.schema import Column
 from ..core.exceptions import ParseError
 
+# Backslash escape inside a quoted string: \\, \' or \"
+_ESCAPE_RE = re.compile(r"""\\(['"\\])""")
+
+def sql_literal(value) -> str:
+    """Render a Python value as a SQL literal the parser reads back unchanged"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+    raise ParseError(f"Unsupported parameter type: {type(value).__name__}")
+
+def unescape_literal(text: str) -> str:
+    """Undo the backslash escapes of a quoted string's contents"""
+    return _ESCAPE_RE.sub(r"\1", text)
+
+def unquote_literal(value_str: str) -> str:
+    """Contents of a quoted SQL string with escapes undone; other text as is"""
+    if len(value_str) >= 2 and value_str[0] in ('\'', '"') and value_str[-1] == value_str[0]:
+        return unescape_literal(value_str[1:-1])
+    return value_str
+
+def scan_quotes(text: str):
+    """Yield (index, char, quoted) per character; quoted covers string literals and their quotes"""
+    quote_char = None
+    escaped = False
+    
+    for i, char in enumerate(text):
+        if quote_char:
+            yield i, char, True
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == quote_char:
+                quote_char = None
+        elif char in ('\'', '"'):
+            quote_char = char
+            yield i, char, True
+        else:
+            yield i, char, False
+
+def placeholder_positions(sql: str) -> List[int]:
+    """Offsets of each ? placeholder outside quoted strings"""
+    return [i for i, char, quoted in scan_quotes(sql) if char == '?' and not quoted]
+
+def bind_params(sql: str, params) -> str:
+    """Replace each ? outside quoted strings with the next parameter as a literal"""
+    params = list(params)
+    positions = placeholder_positions(sql)
+    if len(positions) != len(params):
+        raise ParseError(f"Statement has {len(positions)} placeholder(s) but {len(params)} parameter(s) were given")
+    
+    parts = []
+    start = 0
+    for i, param in zip(positions, params):
+        parts.append(sql[start:i])
+        parts.append(sql_literal(param))
+        start = i + 1
+    parts.append(sql[start:])
+    return ''.join(parts)
+
 class SimpleParser:
     """Parses basic SQL statements with better error handling"""
     
@@ -53,24 +118,35 @@ class SimpleParser:
     
     def _clean_sql(self, sql: str) -> str:
         """Clean SQL string - remove comments, extra spaces, etc."""
-        # Remove SQL comments (-- comment)
+        # Remove SQL comments (-- comment) and join lines, leaving quoted strings intact
         lines = []
-        for line in sql.split('\n'):
-            # Remove inline comments
-            if '--' in line:
-                line = line.split('--')[0]
-            lines.append(line.strip())
+        current = []
+        in_comment = False
+        for i, char, quoted in scan_quotes(sql):
+            if char == '\n' and not quoted:
+                lines.append(''.join(current).strip())
+                current = []
+                in_comment = False
+            elif in_comment:
+                continue
+            elif char == '-' and not quoted and sql.startswith('--', i):
+                in_comment = True
+            else:
+                current.append(char)
+        lines.append(''.join(current).strip())
         
         cleaned = ' '.join(lines).strip()
+        semicolons = [i for i, char, quoted in scan_quotes(cleaned) if char == ';' and not quoted]
         
         # Remove trailing semicolon
-        if cleaned.endswith(';'):
+        if semicolons and semicolons[-1] == len(cleaned) - 1:
             cleaned = cleaned[:-1].strip()
+            semicolons.pop()
         
         # Handle multiple commands separated by semicolons
-        if ';' in cleaned and cleaned.count(';') > 1:
+        if len(semicolons) > 1:
             # For now, just take the first command
-            cleaned = cleaned.split(';')[0].strip()
+            cleaned = cleaned[:semicolons[0]].strip()
         
         return cleaned
     
@@ -199,6 +275,10 @@ class SimpleParser:
                 if i + 1 < len(tokens) and tokens[i + 1].upper() == 'NULL':
                     column.not_null = True
                     i += 2
+                elif i + 1 < len(tokens) and tokens[i + 1].upper() == 'ENFORCED':
+                    # Informational key: declared but never checked on write
+                    column.enforced = False
+                    i += 2
                 else:
                     i += 1
             elif token == 'ENCRYPTED':
@@ -249,50 +329,79 @@ class SimpleParser:
         Parse INSERT statement
         
         Format: INSERT INTO table_name VALUES (val1, val2, ...)
+        Format: INSERT INTO table_name (col1, col2) VALUES (val1, val2), (val3, val4)
         Note: Only handles one INSERT at a time
         """
-        # Match INSERT pattern
-        pattern = r'INSERT\s+INTO\s+(\w+)\s+VALUES\s*\((.*)\)'
+        # Match INSERT pattern, with an optional column list
+        pattern = r'INSERT\s+INTO\s+(\w+)(?:\s*\(([^)]+)\))?\s+VALUES\s*(.*)$'
         match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
         
         if not match:
-            # Also support INSERT INTO table (col1, col2) VALUES (val1, val2)
-            pattern2 = r'INSERT\s+INTO\s+(\w+)\s*\(([^)]+)\)\s+VALUES\s*\(([^)]+)\)'
-            match = re.match(pattern2, sql, re.IGNORECASE | re.DOTALL)
-            if match:
-                table_name = match.group(1).strip()
-                columns_str = match.group(2).strip()
-                values_str = match.group(3).strip()
-                
-                columns = [col.strip() for col in columns_str.split(',')]
-                values = self._parse_values(values_str)
-                
-                if len(columns) != len(values):
-                    raise ParseError(f"Number of columns ({len(columns)}) doesn't match number of values ({len(values)})")
-                
-                return {
-                    'command': 'INSERT',
-                    'table': table_name,
-                    'columns': columns,
-                    'values': values
-                }
-            
             raise ParseError("Invalid INSERT syntax. Use: INSERT INTO table VALUES (...) or INSERT INTO table (col1, col2) VALUES (val1, val2)")
         
         table_name = match.group(1).strip()
-        values_str = match.group(2).strip()
+        columns_str = match.group(2)
         
         if not table_name:
             raise ParseError("Table name cannot be empty")
         
-        # Parse values
-        values = self._parse_values(values_str)
+        # Parse each parenthesized row of values
+        rows = [self._parse_values(group) for group in self._split_value_groups(match.group(3))]
         
-        return {
+        parsed = {
             'command': 'INSERT',
             'table': table_name,
-            'values': values
+            'values': rows[0]
         }
+        
+        if columns_str:
+            columns = [col.strip() for col in columns_str.split(',')]
+            for values in rows:
+                if len(columns) != len(values):
+                    raise ParseError(f"Number of columns ({len(columns)}) doesn't match number of values ({len(values)})")
+            parsed['columns'] = columns
+        
+        # Multi-row INSERT: every row, including the first
+        if len(rows) > 1:
+            parsed['rows'] = rows
+        
+        return parsed
+    
+    def _split_value_groups(self, values_str: str) -> List[str]:
+        """Split '(a, b), (c, d)' into the inner text of each top-level group"""
+        groups = []
+        current = []
+        paren_depth = 0
+        expect_group = True
+        
+        for i, char, quoted in scan_quotes(values_str):
+            if paren_depth == 0:
+                if char == '(' and expect_group:
+                    paren_depth = 1
+                    current = []
+                    expect_group = False
+                elif char == ',' and not expect_group:
+                    expect_group = True
+                elif not char.isspace():
+                    raise ParseError("Invalid VALUES list. Use: VALUES (val1, val2), (val3, val4)")
+                continue
+            
+            if quoted:
+                pass
+            elif char == '(':
+                paren_depth += 1
+            elif char == ')':
+                paren_depth -= 1
+                if paren_depth == 0:
+                    groups.append(''.join(current))
+                    continue
+            
+            current.append(char)
+        
+        if paren_depth != 0 or expect_group:
+            raise ParseError("Invalid VALUES list. Use: VALUES (val1, val2), (val3, val4)")
+        
+        return groups
     
     def _parse_select(self, sql: str) -> Dict:
         """
@@ -329,7 +438,7 @@ class SimpleParser:
         # Check for WHERE clause
         where_clause = None
         if 'WHERE' in sql.upper():
-            where_match = re.search(r'WHERE\s+(.+)$', sql, re.IGNORECASE)
+            where_match = re.search(r'WHERE\s+(.+)$', sql, re.IGNORECASE | re.DOTALL)
             if where_match:
                 where_clause = where_match.group(1).strip()
         
@@ -348,7 +457,7 @@ class SimpleParser:
         """
         # Match UPDATE pattern
         pattern = r'UPDATE\s+(\w+)\s+SET\s+(.+?)(?:\s+WHERE\s+(.+))?$'
-        match = re.match(pattern, sql, re.IGNORECASE)
+        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
         
         if not match:
             raise ParseError("Invalid UPDATE syntax. Format: UPDATE table SET column = value WHERE condition")
@@ -391,7 +500,7 @@ class SimpleParser:
         """
         # Match DELETE pattern
         pattern = r'DELETE\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+))?$'
-        match = re.match(pattern, sql, re.IGNORECASE)
+        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
         
         if not match:
             raise ParseError("Invalid DELETE syntax. Format: DELETE FROM table WHERE condition")
@@ -505,32 +614,18 @@ class SimpleParser:
         """Parse comma-separated values, handling quoted strings and nested parentheses"""
         values = []
         current = []
-        in_quotes = False
-        quote_char = None
         paren_depth = 0
         
-        i = 0
-        while i < len(values_str):
-            char = values_str[i]
-            
-            if char in ('\'', '"') and not in_quotes:
-                in_quotes = True
-                quote_char = char
+        for i, char, quoted in scan_quotes(values_str):
+            if quoted:
                 current.append(char)
-            elif char == quote_char and in_quotes:
-                # Check if it's escaped
-                if i > 0 and values_str[i-1] == '\\':
-                    current.append(char)
-                else:
-                    in_quotes = False
-                    current.append(char)
-            elif char == '(' and not in_quotes:
+            elif char == '(':
                 paren_depth += 1
                 current.append(char)
-            elif char == ')' and not in_quotes:
+            elif char == ')':
                 paren_depth -= 1
                 current.append(char)
-            elif char == ',' and not in_quotes and paren_depth == 0:
+            elif char == ',' and paren_depth == 0:
                 # End of value
                 value_str = ''.join(current).strip()
                 value = self._parse_value(value_str)
@@ -538,8 +633,6 @@ class SimpleParser:
                 current = []
             else:
                 current.append(char)
-            
-            i += 1
         
         # Last value
         if current:
@@ -563,11 +656,8 @@ class SimpleParser:
         # Check for quoted string
         if (value_str.startswith("'") and value_str.endswith("'")) or \
            (value_str.startswith('"') and value_str.endswith('"')):
-            # Remove quotes
-            unquoted = value_str[1:-1]
-            # Handle escaped quotes
-            unquoted = unquoted.replace("\\'", "'").replace('\\"', '"')
-            return unquoted
+            # Remove quotes and handle escaped quotes and backslashes
+            return unquote_literal(value_str)
         
         # Check for boolean
         if value_str.upper() in ('TRUE', 'FALSE'):
@@ -6,12 +6,24 @@ Column-level encryption system with key persistence
 import os
 import base64
 import json
+from functools import lru_cache
 from typing import Union, Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from ..core.exceptions import EncryptionError
 
+@lru_cache(maxsize=128)
+def _derive_column_key(master_key: bytes, salt: bytes) -> bytes:
+    """Run PBKDF2 once per (master key, salt), shared by all encryptors"""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    return kdf.derive(master_key)
+
 class ColumnEncryptor:
     """Encrypt/decrypt values for specific columns"""
     
@@ -100,15 +112,8 @@ class ColumnEncryptor:
             # Generate salt from column_id
             salt = column_id.encode()[:16].ljust(16, b'\0')
         
-        # Derive key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        
-        key = kdf.derive(self.master_key)
+        # Derive key using PBKDF2 (memoized across Database instances)
+        key = _derive_column_key(self.master_key, salt)
         self.column_keys[column_id] = key
         return key
     
@@ -183,10 +188,36 @@ class ColumnEncryptor:
                 print(f"⚠️  Decryption failed for {column_id}: {e}")
             return "[ENCRYPTED]"
     
+    def decrypt_many(self, column_id: str, encrypted_values: list) -> list:
+        """
+        Decrypt many values of one column, setting up the key and cipher once
+        
+        Empty values decrypt to "" and values that fail to decrypt to
+        "[ENCRYPTED]", as with decrypt_value.
+        """
+        key = self.get_column_key(column_id)
+        aesgcm = AESGCM(key)
+        associated_data = column_id.encode('utf-8')
+        
+        plaintexts = []
+        for encrypted in encrypted_values:
+            if encrypted is None or encrypted == "":
+                plaintexts.append("")
+                continue
+            try:
+                combined = base64.b64decode(encrypted)
+                plaintext = aesgcm.decrypt(combined[:12], combined[12:], associated_data)
+                plaintexts.append(plaintext.decode('utf-8'))
+            except Exception as e:
+                if not self.silent:
+                    print(f"⚠️  Decryption failed for {column_id}: {e}")
+                plaintexts.append("[ENCRYPTED]")
+        return plaintexts
+    
     def bulk_encrypt(self, column_id: str, values: list) -> list:
         """Encrypt multiple values for a column"""
         return [self.encrypt_value(column_id, str(v)) if v is not None else "" for v in values]
     
     def bulk_decrypt(self, column_id: str, encrypted_values: list) -> list:
         """Decrypt multiple values for a column"""
-        return [self.decrypt_value(column_id, v) if v else "" for v in encrypted_values]
\ No newline at end of file
+        return self.decrypt_many(column_id, [v if v else "" for v in encrypted_values])
\ No newline at end of file
@@ -3,9 +3,11 @@ Simple file storage - using CSV format for now
 We'll upgrade to binary later
 """
 import csv
+import io
+import locale
 import os
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 class FileManager:
     """Simple CSV-based storage"""
@@ -14,6 +16,10 @@ class FileManager:
         self.db_file = db_file
         self.data_dir = db_file.replace('.maldb', '_data')
         os.makedirs(self.data_dir, exist_ok=True)
+        # table -> (file stamp, [(byte offset, byte length)] per row)
+        self._row_offsets: Dict[str, Tuple[Tuple, List[Tuple[int, int]]]] = {}
+        # table -> (file stamp, row count), kept current by this manager's own writes
+        self._row_counts: Dict[str, Tuple[Tuple, int]] = {}
     
     def table_file(self, table_name: str) -> str:
         """Get CSV file path for a table"""
@@ -40,6 +46,8 @@ class FileManager:
         """Insert a row into CSV file"""
         file_path = self.table_file(table_name)
         
+        count = self._cached_row_count(table_name)
+        
         # Create file if it doesn't exist
         if not os.path.exists(file_path):
             with open(file_path, 'w', newline='') as f:
@@ -49,6 +57,15 @@ class FileManager:
         with open(file_path, 'a', newline='') as f:
             writer = csv.writer(f)
             writer.writerow(row)
+        self._store_row_count(table_name, count + 1 if count is not None else None)
+    
+    def insert_rows(self, table_name: str, rows: List[List]):
+        """Append several rows to the CSV file with a single open"""
+        count = self._cached_row_count(table_name)
+        with open(self.table_file(table_name), 'a', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerows(rows)
+        self._store_row_count(table_name, count + len(rows) if count is not None else None)
     
     def get_all_rows(self, table_name: str) -> List[List]:
         """Get all rows from CSV file"""
@@ -65,9 +82,110 @@ class FileManager:
         
         return rows
     
+    def get_rows_at(self, table_name: str, positions: List[int]) -> List[List]:
+        """Rows at the given positions, each read by seeking to its byte offset"""
+        offsets = self.row_offsets(table_name)
+        encoding = locale.getpreferredencoding(False)
+        
+        rows = []
+        with open(self.table_file(table_name), 'rb') as f:
+            for position in positions:
+                offset, length = offsets[position]
+                f.seek(offset)
+                text = f.read(length).decode(encoding)
+                rows.extend(csv.reader(io.StringIO(text, newline='')))
+        return rows
+    
+    def iter_rows(self, table_name: str) -> Iterator[List]:
+        """Yield rows from the CSV file one at a time"""
+        file_path = self.table_file(table_name)
+        
+        if not os.path.exists(file_path):
+            return
+        
+        with open(file_path, 'r', newline='') as f:
+            yield from csv.reader(f)
+    
+    def count_rows(self, table_name: str) -> int:
+        """Number of rows in the table, scanning the CSV only if it changed behind our back"""
+        count = self._cached_row_count(table_name)
+        if count is None:
+            count = sum(1 for _ in self.iter_rows(table_name))
+            self._store_row_count(table_name, count)
+        return count
+    
+    def _cached_row_count(self, table_name: str) -> Optional[int]:
+        """Row count remembered for the file's current contents, or None if unknown"""
+        file_path = self.table_file(table_name)
+        if not os.path.exists(file_path):
+            return 0
+        cached = self._row_counts.get(table_name)
+        if cached is not None and cached[0] == self._file_stamp(file_path):
+            return cached[1]
+        return None
+    
+    def _store_row_count(self, table_name: str, count: Optional[int]):
+        """Remember a row count against the file as it is now; None forgets it"""
+        file_path = self.table_file(table_name)
+        if count is None or not os.path.exists(file_path):
+            self._row_counts.pop(table_name, None)
+        else:
+            self._row_counts[table_name] = (self._file_stamp(file_path), count)
+    
+    def table_stamp(self, table_name: str) -> Optional[Tuple]:
+        """Identity of a table's stored rows, or None if it has no data file; changes on every write"""
+        file_path = self.table_file(table_name)
+        return self._file_stamp(file_path) if os.path.exists(file_path) else None
+    
+    @staticmethod
+    def _file_stamp(file_path: str) -> Tuple:
+        """Identity of a file's current contents for the row-offset cache"""
+        st = os.stat(file_path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def row_offsets(self, table_name: str) -> List[Tuple[int, int]]:
+        """Byte (offset, length) of every row, rescanned only when the file changes"""
+        file_path = self.table_file(table_name)
+        stamp = self._file_stamp(file_path)
+        cached = self._row_offsets.get(table_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        offsets = []
+        with open(file_path, 'rb') as f:
+            start = end = quotes = 0
+            for line in f:
+                end += len(line)
+                # A newline inside a quoted field leaves an odd number of quotes
+                quotes += line.count(b'"')
+                if quotes % 2 == 0:
+                    offsets.append((start, end - start))
+                    start, quotes = end, 0
+        
+        self._row_offsets[table_name] = (stamp, offsets)
+        return offsets
+    
     def update_row(self, table_name: str, row_index: int, new_row: List):
-        """Update a specific row in a table"""
+        """Update a specific row in a table, overwriting it in place when its size is unchanged"""
         file_path = self.table_file(table_name)
+        
+        offsets = self.row_offsets(table_name)
+        if row_index < len(offsets):
+            offset, length = offsets[row_index]
+            buffer = io.StringIO(newline='')
+            csv.writer(buffer).writerow(new_row)
+            data = buffer.getvalue().encode(locale.getpreferredencoding(False))
+            if len(data) == length:
+                with open(file_path, 'r+b') as f:
+                    f.seek(offset)
+                    f.write(data)
+                self._row_offsets[table_name] = (self._file_stamp(file_path), offsets)
+                self._store_row_count(table_name, len(offsets))
+                return
+        
+        # Size changed: rewrite the file, shifting every later row
+        self._row_offsets.pop(table_name, None)
+        count = self._cached_row_count(table_name)
         temp_file = file_path + '.tmp'
         
         try:
@@ -85,6 +203,7 @@ class FileManager:
             
             # Replace original file
             os.replace(temp_file, file_path)
+            self._store_row_count(table_name, count)
             
         except Exception as e:
             # Clean up temp file if it exists
@@ -99,6 +218,8 @@ class FileManager:
     def delete_row_by_index(self, table_name: str, row_index: int):
         """Delete a row by index"""
         file_path = self.table_file(table_name)
+        self._row_offsets.pop(table_name, None)
+        count = self._cached_row_count(table_name)
         temp_file = file_path + '.tmp'
         
         try:
@@ -114,6 +235,9 @@ class FileManager:
             
             # Replace original file
             os.replace(temp_file, file_path)
+            if count is not None and row_index < count:
+                count -= 1
+            self._store_row_count(table_name, count)
             
         except Exception as e:
             # Clean up temp file if it exists
@@ -124,8 +248,12 @@ class FileManager:
     def save_all_rows(self, table_name: str, rows: List[List]):
         """Save all rows to CSV file (overwrites existing)"""
         file_path = self.table_file(table_name)
+        self._row_offsets.pop(table_name, None)
         
+        count = 0
         with open(file_path, 'w', newline='') as f:
             writer = csv.writer(f)
             for row in rows:
-                writer.writerow(row)
\ No newline at end of file
+                writer.writerow(row)
+                count += 1
+        self._store_row_count(table_name, count)
\ No newline at end of file
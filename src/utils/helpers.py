@@ -5,6 +5,21 @@ import os
 import json
 from typing import Any, Dict, List
 
+def uvicorn_fast_path() -> Dict[str, str]:
+    """uvloop and httptools when they are installed; uvicorn's defaults otherwise"""
+    options = {}
+    try:
+        import uvloop  # noqa: F401
+        options["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        options["http"] = "httptools"
+    except ImportError:
+        pass
+    return options
+
 def get_file_size(file_path: str) -> int:
     """Get file size in bytes"""
     try:
@@ -0,0 +1,97 @@
+"""
+Tests for the REST API's SELECT result cache
+"""
+import asyncio
+import json
+import os
+import tempfile
+import pytest
+from src.api import server
+from src.api.models import QueryRequest
+from src.core.database import Database
+
+
+@pytest.fixture
+def api_db(monkeypatch):
+    """Server bound to a fresh database with one table, counting engine calls"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'api.maldb'))
+        db.execute("CREATE TABLE items (id INT PRIMARY KEY, name VARCHAR(50))")
+        db.execute("INSERT INTO items VALUES (1, 'a'), (2, 'b')")
+        
+        calls = []
+        execute = db.execute
+        def counting_execute(sql, params=None):
+            calls.append(sql)
+            return execute(sql, params)
+        monkeypatch.setattr(db, 'execute', counting_execute)
+        monkeypatch.setattr(server, 'db_instance', db)
+        server._query_cache.clear()
+        yield calls
+        server._query_cache.clear()
+
+
+def run_query(sql, params=None):
+    """Call /api/execute and return its decoded JSON body"""
+    response = asyncio.run(server.execute_query(QueryRequest(sql=sql, params=params)))
+    return json.loads(response.body)
+
+
+def test_repeated_select_is_served_from_cache(api_db):
+    """A repeated SELECT returns the cached rows without running the engine again"""
+    first = run_query("SELECT * FROM items")
+    second = run_query("SELECT * FROM items")
+    
+    assert first["result"] == second["result"] == [[1, 'a'], [2, 'b']]
+    assert len(api_db) == 1
+
+
+@pytest.mark.parametrize("write_sql", [
+    "INSERT INTO items VALUES (3, 'c')",
+    "UPDATE items SET name = 'z' WHERE id = 1",
+    "CREATE TABLE other (id INT)",
+])
+def test_write_clears_cache(api_db, write_sql):
+    """Any non-SELECT statement empties the cache so the next SELECT sees its effect"""
+    before = run_query("SELECT * FROM items")["result"]
+    assert run_query(write_sql)["success"]
+    assert len(server._query_cache) == 0
+    
+    after = run_query("SELECT * FROM items")["result"]
+    assert len(api_db) == 3
+    if write_sql.startswith(("INSERT", "UPDATE")):
+        assert after != before
+
+
+def test_different_params_miss_cache(api_db):
+    """The same SQL with different parameters is cached separately"""
+    assert run_query("SELECT name FROM items WHERE id = ?", [1])["result"] == [['a']]
+    assert run_query("SELECT name FROM items WHERE id = ?", [2])["result"] == [['b']]
+    assert run_query("SELECT name FROM items WHERE id = ?", [1])["result"] == [['a']]
+    assert len(api_db) == 2
+
+
+def test_cache_evicts_least_recently_used(api_db, monkeypatch):
+    """Beyond _CACHE_MAX entries the least recently used SELECT is dropped"""
+    monkeypatch.setattr(server, '_CACHE_MAX', 2)
+    run_query("SELECT * FROM items WHERE id = 1")
+    run_query("SELECT * FROM items WHERE id = 2")
+    run_query("SELECT * FROM items WHERE id = 1")
+    run_query("SELECT * FROM items")
+    
+    assert [sql for sql, params in server._query_cache] == [
+        "SELECT * FROM items WHERE id = 1", "SELECT * FROM items"
+    ]
+    run_query("SELECT * FROM items WHERE id = 2")
+    assert len(api_db) == 4
+
+
+def test_flush_endpoint_empties_cache(api_db):
+    """/api/cache/flush reports how many results it dropped"""
+    run_query("SELECT * FROM items")
+    run_query("SELECT * FROM items WHERE id = 1")
+    
+    assert asyncio.run(server.flush_query_cache()) == {"success": True, "flushed": 2}
+    assert len(server._query_cache) == 0
+    run_query("SELECT * FROM items")
+    assert len(api_db) == 3
@@ -3,7 +3,11 @@ Integration tests
 """
 import tempfile
 import os
+import pytest
 from src.core.database import Database
+from src.core.exceptions import DatabaseError
+from src.catalog.index import NGramIndex, SortedIndex
+
 
 def test_full_workflow():
     """Test complete database workflow"""
@@ -50,4 +54,210 @@ def test_full_workflow():
         data_dir = db_file.replace('.maldb', '_data')
         if os.path.exists(data_dir):
             import shutil
-            shutil.rmtree(data_dir)
\ No newline at end of file
+            shutil.rmtree(data_dir)
+
+
+def test_count_and_list_tables():
+    """COUNT(*) and list_tables work without scanning decrypted rows"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'count.maldb'))
+        db.execute("CREATE TABLE users (id INT, name VARCHAR(50))")
+        db.execute("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')")
+        
+        assert db.list_tables() == ['users']
+        assert db.execute("SELECT COUNT(*) FROM users") == [(2,)]
+        assert db.execute("SELECT COUNT(*) FROM users WHERE id = 2") == [(1,)]
+
+
+def test_execute_with_params():
+    """Bound parameters round-trip through INSERT and WHERE"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'params.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(50), password TEXT ENCRYPTED)")
+        db.execute("INSERT INTO users VALUES (?, ?, ?)", (1, "O'Brien", "s3cret?"))
+        db.execute("INSERT INTO users VALUES (?, ?, ?)", (2, "Bob", "hunter2"))
+        
+        assert db.execute("SELECT * FROM users WHERE id = ?", [1]) == [(1, "O'Brien", "s3cret?")]
+        assert db.execute("SELECT id FROM users WHERE name = ?", ["O'Brien"]) == [(1,)]
+        assert db.execute("SELECT id FROM users WHERE name = ?", ["Bob"]) == [(2,)]
+        
+        # Values that would end or cut the literal if pasted into the SQL text
+        tricky = ["a\\", "x -- y", "it\\'s"]
+        for user_id, name in enumerate(tricky, start=3):
+            db.execute("INSERT INTO users VALUES (?, ?, ?)", (user_id, name, name))
+        for user_id, name in enumerate(tricky, start=3):
+            assert db.execute("SELECT * FROM users WHERE name = ?", [name]) == [(user_id, name, name)]
+
+
+def test_params_reuse_parsed_template():
+    """Each SQL template is parsed once, whatever values are bound to it"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'plans.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(50))")
+        
+        for user_id in range(1, 4):
+            db.execute("INSERT INTO users VALUES (?, ?)", (user_id, f"user, {user_id}"))
+        for user_id in range(1, 4):
+            assert db.execute("SELECT name FROM users WHERE id = ?", [user_id]) == [(f"user, {user_id}",)]
+        db.execute("UPDATE users SET name = ? WHERE id = ?", ["renamed, again", 2])
+        assert list(db.iter_execute("SELECT id FROM users WHERE name = ?", ["renamed, again"])) == [(2,)]
+        
+        info = db._prepare_cached.cache_info()
+        assert info.misses == 4
+        assert info.hits == 4
+
+
+def test_prepared_statement():
+    """Prepared statements parse once and bind values into the parsed template"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'prepared.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(50), password TEXT ENCRYPTED)")
+        
+        insert = db.prepare("INSERT INTO users (id, name, password) VALUES (?, ?, ?)")
+        insert.execute((1, "O'Brien", "s3cret?"))
+        insert.execute((2, "Bob", "hunter2"))
+        
+        select = db.prepare("SELECT id FROM users WHERE name = ?")
+        assert select.execute(["O'Brien"]) == [(1,)]
+        assert db.execute("SELECT * FROM users") == [(1, "O'Brien", "s3cret?"), (2, "Bob", "hunter2")]
+        
+        with pytest.raises(DatabaseError):
+            insert.execute((1, "Dup", "x"))
+        with pytest.raises(DatabaseError):
+            insert.execute((3, "Short"))
+        
+        # Non-INSERT statements bind through the text path, which keeps these values quoted
+        insert.execute((3, "x -- y", "z\\"))
+        assert select.execute(["x -- y"]) == [(3,)]
+        db.prepare("UPDATE users SET name = ? WHERE name = ?").execute(["a\\", "x -- y"])
+        assert select.execute(["a\\"]) == [(3,)]
+        db.prepare("DELETE FROM users WHERE name = ?").execute(["a\\"])
+        assert db.count("users") == 2
+
+
+def test_iter_execute_streams_select():
+    """iter_execute yields the same rows as execute, lazily"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'iter.maldb'))
+        db.execute("CREATE TABLE items (id INT PRIMARY KEY, name VARCHAR(50), secret TEXT ENCRYPTED)")
+        db.execute("INSERT INTO items VALUES (1, 'a', 'x'), (2, 'b', 'y'), (3, 'c', 'z')")
+        
+        rows = db.iter_execute("SELECT id, secret FROM items WHERE id > ?", [1])
+        assert next(rows) == (2, 'y')
+        assert list(rows) == [(3, 'z')]
+        assert list(db.iter_execute("SELECT * FROM items")) == db.execute("SELECT * FROM items")
+        assert list(db.iter_execute("SELECT COUNT(*) FROM items")) == [(3,)]
+
+
+def test_insert_many():
+    """insert_many writes every row at once and enforces constraints across the batch"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'many.maldb'))
+        db.execute("CREATE TABLE items (id INT PRIMARY KEY, name VARCHAR(50), secret TEXT ENCRYPTED)")
+        
+        assert db.insert_many("items", [(1, 'a', 'x'), (2, 'b', 'y')]) == 2
+        assert db.insert_many("items", [(3, 'c', 'z')], columns=["id", "name", "secret"]) == 1
+        assert db.execute("SELECT * FROM items") == [(1, 'a', 'x'), (2, 'b', 'y'), (3, 'c', 'z')]
+        
+        with pytest.raises(DatabaseError):
+            db.insert_many("items", [(4, 'd', 'v'), (4, 'e', 'w')])
+        assert db.count("items") == 3
+
+
+def test_count_reads_row_count_from_storage():
+    """Database.count matches COUNT(*) and rejects unknown tables"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'count.maldb'))
+        db.execute("CREATE TABLE items (id INT PRIMARY KEY, secret TEXT ENCRYPTED)")
+        assert db.count("items") == 0
+        
+        db.execute("INSERT INTO items VALUES (1, 'x'), (2, 'y')")
+        assert db.count("items") == 2
+        assert db.execute("SELECT COUNT(*) FROM items") == [(2,)]
+        
+        with pytest.raises(DatabaseError):
+            db.count("missing")
+
+
+def test_inner_join_matches_on_key():
+    """JOIN pairs each row with every matching row of the other table, in table order"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'join.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(20))")
+        db.execute("CREATE TABLE orders (id INT PRIMARY KEY, user_id INT)")
+        db.execute("INSERT INTO users VALUES (1, 'alice'), (2, 'bob')")
+        db.execute("INSERT INTO orders VALUES (10, 2), (11, 1), (12, 2), (13, 5)")
+        
+        assert db.execute("SELECT * FROM users JOIN orders ON users.id = orders.user_id") == [
+            (1, 'alice', 11, 1), (2, 'bob', 10, 2), (2, 'bob', 12, 2)
+        ]
+        assert db.execute("SELECT * FROM users JOIN orders ON orders.user_id = users.id") == [
+            (1, 'alice', 11, 1), (2, 'bob', 10, 2), (2, 'bob', 12, 2)
+        ]
+
+
+def test_like_prefix_uses_sorted_index():
+    """LIKE filters by pattern; anchored prefixes are answered from a cached index"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'like.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, username VARCHAR(50), secret TEXT ENCRYPTED)")
+        db.execute("INSERT INTO users VALUES (1, 'alice', 'a'), (2, 'bob', 'b'), (3, 'alison', 'c'), (4, 'malik', 'd')")
+        
+        assert db.execute("SELECT id FROM users WHERE username LIKE 'ali%'") == [(1,), (3,)]
+        assert db.execute("SELECT id FROM users WHERE username LIKE '%li%'") == [(1,), (3,), (4,)]
+        assert db.execute("SELECT id FROM users WHERE username LIKE 'b_b'") == [(2,)]
+        assert db.execute("SELECT id FROM users WHERE secret LIKE 'c%'") == [(3,)]
+        assert ('users', 'username', SortedIndex) in db.executor._indexes
+        
+        # The index is rebuilt once the table changes
+        db.execute("INSERT INTO users VALUES (5, 'alibaba', 'e')")
+        assert db.execute("SELECT id FROM users WHERE username LIKE 'ali%'") == [(1,), (3,), (5,)]
+        assert list(db.iter_execute("SELECT COUNT(*) FROM users WHERE username LIKE 'ali%'")) == [(3,)]
+
+
+def test_like_substring_uses_ngram_index():
+    """Unanchored LIKE patterns narrow candidates by trigram before the exact check"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'ngram.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, email VARCHAR(100))")
+        db.execute("INSERT INTO users VALUES (1, 'alice@example.com'), (2, 'bob@company.com'), "
+                   "(3, 'carol@example.org'), (4, 'dave@sample.com')")
+        
+        assert db.execute("SELECT id FROM users WHERE email LIKE '%ample.com'") == [(1,), (4,)]
+        assert db.execute("SELECT id FROM users WHERE email LIKE '%@exa%'") == [(1,), (3,)]
+        assert db.execute("SELECT id FROM users WHERE email LIKE '%ob%'") == [(2,)]
+        assert ('users', 'email', NGramIndex) in db.executor._indexes
+        
+        # Once cached, only the candidate rows are read back from storage
+        def no_full_scan(table_name):
+            raise AssertionError("full table read")
+        db.file_manager.get_all_rows = no_full_scan
+        assert db.execute("SELECT * FROM users WHERE email LIKE '%ample.com'") == [
+            (1, 'alice@example.com'), (4, 'dave@sample.com')
+        ]
+        assert db.execute("SELECT id FROM users WHERE email LIKE '%@exa%'") == [(1,), (3,)]
+
+
+def test_like_indexes_dropped_on_write(monkeypatch):
+    """Writes drop cached LIKE indexes even when the table stamp does not change"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, 'stale.maldb'))
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, username VARCHAR(50))")
+        db.execute("INSERT INTO users VALUES (1, 'alice'), (2, 'bob')")
+        
+        # Coarse mtime: every write leaves the stamp as it was
+        monkeypatch.setattr(db.file_manager, 'table_stamp', lambda table_name: (1, 1, 1))
+        assert db.execute("SELECT id FROM users WHERE username LIKE 'bob%'") == [(2,)]
+        assert db.execute("SELECT id FROM users WHERE username LIKE '%lic%'") == [(1,)]
+        
+        db.execute("UPDATE users SET username = 'bobby' WHERE id = 1")
+        assert db.execute("SELECT id FROM users WHERE username LIKE 'bob%'") == [(1,), (2,)]
+        assert db.execute("SELECT id FROM users WHERE username LIKE '%obb%'") == [(1,)]
+        
+        db.execute("INSERT INTO users VALUES (3, 'bobcat')")
+        db.execute("DELETE FROM users WHERE id = 2")
+        assert db.execute("SELECT id FROM users WHERE username LIKE 'bob%'") == [(1,), (3,)]
+        
+        index = NGramIndex.build('email', [('alice', 0), ('malice', 1), ('bob', 2)])
+        assert index.query('%lic%') == {0, 1}
+        assert index.query('%li%') is None
@@ -2,7 +2,8 @@
 Tests for SQL parser
 """
 import pytest
-from src.parser.parser import SimpleParser
+from src.parser.parser import SimpleParser, bind_params
+from src.core.exceptions import ParseError
 
 def test_parse_create_table():
     """Test CREATE TABLE parsing"""
@@ -29,6 +30,17 @@ def test_parse_insert():
     assert parsed['table'] == 'users'
     assert parsed['values'] == [1, 'Alice', 25]
 
+def test_parse_multi_row_insert():
+    """Test multi-row INSERT parsing"""
+    parser = SimpleParser()
+    
+    sql = "INSERT INTO users (id, name) VALUES (1, 'Alice'), (2, 'Bob, Jr.')"
+    parsed = parser.parse(sql)
+    
+    assert parsed['command'] == 'INSERT'
+    assert parsed['columns'] == ['id', 'name']
+    assert parsed['rows'] == [[1, 'Alice'], [2, 'Bob, Jr.']]
+
 def test_parse_select():
     """Test SELECT parsing"""
     parser = SimpleParser()
@@ -38,4 +50,36 @@ def test_parse_select():
     
     assert parsed['command'] == 'SELECT'
     assert parsed['table'] == 'users'
-    assert parsed['columns'] == ['*']
\ No newline at end of file
+    assert parsed['columns'] == ['*']
+def test_parse_not_enforced_constraints():
+    """Test PRIMARY KEY / UNIQUE ... NOT ENFORCED parsing"""
+    parser = SimpleParser()
+    
+    sql = "CREATE TABLE t (id INT PRIMARY KEY NOT ENFORCED, email VARCHAR(100) UNIQUE NOT ENFORCED, name TEXT NOT NULL)"
+    parsed = parser.parse(sql)
+    
+    id_col, email_col, name_col = parsed['columns']
+    assert id_col.primary_key and not id_col.enforced
+    assert email_col.unique and not email_col.enforced
+    assert name_col.not_null and name_col.enforced
+
+def test_bind_params():
+    """Test ? placeholders are replaced with SQL literals outside quotes"""
+    sql = bind_params("INSERT INTO t VALUES (?, ?, ?, ?, '?')", [1, "O'Brien", None, True])
+    assert sql == "INSERT INTO t VALUES (1, 'O\\'Brien', NULL, TRUE, '?')"
+    
+    parsed = SimpleParser().parse(sql)
+    assert parsed['values'] == [1, "O'Brien", None, True, '?']
+    
+    # Backslashes, comment markers and semicolons stay inside the literal
+    tricky = ["a\\", "x -- y", "it\\'s", "a; b; c"]
+    parsed = SimpleParser().parse(bind_params("INSERT INTO t VALUES (?, ?, ?, ?)", tricky))
+    assert parsed['values'] == tricky
+    
+    parsed = SimpleParser().parse(bind_params("SELECT * FROM t WHERE name = ? -- note", ["x -- y"]))
+    assert parsed['where'] == "name = 'x -- y'"
+    
+    with pytest.raises(ParseError):
+        bind_params("SELECT * FROM t WHERE id = ?", [])
+    with pytest.raises(ParseError):
+        bind_params("SELECT * FROM t", [1])
@@ -6,6 +6,7 @@ import tempfile
 import pytest
 from src.storage.file_manager import FileManager
 
+
 def test_file_manager_creation():
     """Test FileManager initialization"""
     with tempfile.NamedTemporaryFile(suffix='.maldb') as tmp:
@@ -19,6 +20,7 @@ def test_file_manager_creation():
         schema_file = fm.schema_file('test_table')
         assert 'test_table_schema.json' in schema_file
 
+
 def test_schema_save_load():
     """Test saving and loading schema"""
     with tempfile.NamedTemporaryFile(suffix='.maldb') as tmp:
@@ -32,6 +34,7 @@ def test_schema_save_load():
         loaded = fm.load_schema('test_table')
         assert loaded == schema
 
+
 def test_insert_and_retrieve():
     """Test inserting and retrieving rows"""
     with tempfile.NamedTemporaryFile(suffix='.maldb') as tmp:
@@ -45,4 +48,55 @@ def test_insert_and_retrieve():
         rows = fm.get_all_rows('test_table')
         assert len(rows) == 2
         assert rows[0] == ['1', 'Alice', '25']
-        assert rows[1] == ['2', 'Bob', '30']
\ No newline at end of file
+        assert rows[1] == ['2', 'Bob', '30']
+
+
+def test_column_key_derivation_is_shared():
+    """Test that encryptors with the same master key reuse derived keys"""
+    from src.storage.encryption import ColumnEncryptor, _derive_column_key
+    
+    master_key = bytes(range(32))
+    first = ColumnEncryptor(master_key=master_key, silent=True)
+    second = ColumnEncryptor(master_key=master_key, silent=True)
+    
+    encrypted = first.encrypt_value('users.password', 'secret')
+    hits_before = _derive_column_key.cache_info().hits
+    
+    assert second.decrypt_value('users.password', encrypted) == 'secret'
+    assert _derive_column_key.cache_info().hits == hits_before + 1
+
+
+def test_update_row_in_place_and_resized():
+    """update_row keeps every other row intact whether or not the row size changes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fm = FileManager(os.path.join(tmp_dir, 'update.maldb'))
+        fm.insert_rows('t', [[1, 'Alice'], [2, 'multi\nline'], [3, 'Carol']])
+        
+        fm.update_row('t', 2, [3, 'Karol'])
+        assert fm.get_all_rows('t') == [['1', 'Alice'], ['2', 'multi\nline'], ['3', 'Karol']]
+        
+        fm.update_row('t', 0, [1, 'Alexandra'])
+        fm.update_row('t', 2, [3, 'Carl'])
+        assert fm.get_all_rows('t') == [['1', 'Alexandra'], ['2', 'multi\nline'], ['3', 'Carl']]
+
+
+def test_row_count_tracks_writes():
+    """count_rows stays correct across this manager's writes and external changes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fm = FileManager(os.path.join(tmp_dir, 'count.maldb'))
+        assert fm.count_rows('t') == 0
+        
+        fm.insert_rows('t', [[1, 'a'], [2, 'b']])
+        fm.insert_row('t', [3, 'c'])
+        assert fm.count_rows('t') == 3
+        
+        fm.delete_row_by_index('t', 0)
+        fm.update_row('t', 0, [2, 'bbb'])
+        assert fm.count_rows('t') == 2
+        
+        # A second manager on the same files writes behind the first one's back
+        FileManager(os.path.join(tmp_dir, 'count.maldb')).insert_row('t', [4, 'd'])
+        assert fm.count_rows('t') == 3
+        
+        fm.save_all_rows('t', [[1, 'x']])
+        assert fm.count_rows('t') == 1